@@ -2,23 +2,56 @@
 Bishop Bot - Audio Manager (Simplified)
 Last updated: 2025-05-31 23:13:05 UTC by Bioku87
 """
+import io
 import os
+import json
+import bisect
+import asyncio
 import logging
+import subprocess
+from functools import cached_property, lru_cache
 import discord
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
 
 logger = logging.getLogger('bishop_bot.audio')
 
+# Supported audio file extensions (lowercase, without the dot)
+AUDIO_EXT_SET = frozenset({'mp3', 'wav', 'ogg', 'flac'})
+
+# Cached scan index so startup only re-stats changed files
+INDEX_FILE = "data/audio/soundboard/.index.json"
+
+# Only clips up to this size are decoded into the in-memory PCM cache
+PCM_CACHE_MAX_FILE_SIZE = 2 * 1024 * 1024
+
+@lru_cache(maxsize=64)
+def _decode_pcm(file_path, mtime):
+    """Decode a clip to raw 48kHz stereo s16le PCM, cached across plays
+
+    mtime is part of the cache key only: when a file is replaced in
+    place (e.g. a sound re-uploaded under an existing name) the new
+    mtime misses the cache instead of replaying the stale PCM.
+    """
+    return subprocess.check_output([
+        'ffmpeg', '-loglevel', 'quiet', '-i', file_path,
+        '-f', 's16le', '-ac', '2', '-ar', '48000', '-'
+    ])
+
 class AudioTrack:
     """Represents an audio track for the soundboard"""
-    
-    def __init__(self, name, category, file_path, **kwargs):
+
+    __slots__ = ('name', 'category', 'file_path', 'tags', 'duration', 'mtime', 'size')
+
+    def __init__(self, name, category, file_path, tags=None, duration=0.0, mtime=0, size=0):
         self.name = name
         self.category = category
         self.file_path = file_path
-        self.tags = kwargs.get('tags', [category.lower()])
-        self.duration = kwargs.get('duration', 0.0)
+        self.tags = tags if tags is not None else [category.lower()]
+        self.duration = duration
+        self.mtime = mtime
+        self.size = size
         
 
 class AudioManager:
@@ -29,47 +62,192 @@ class AudioManager:
         self.bot = bot
         self.voice_clients = {}  # guild_id -> voice_client
         self.now_playing = {}  # guild_id -> currently playing track
-        
-        # Scan for audio files
-        self.sound_library = self._scan_audio_files()
-        
+        self._ensured_dirs = set()  # directories already created this session
+
         logger.info("Audio manager initialized")
+
+    @cached_property
+    def sound_library(self):
+        """Sound library, scanned lazily on first access"""
+        return self._scan_audio_files()
+
+    @cached_property
+    def _sound_index(self):
+        """Fast lookup index: category -> lowercase name -> track"""
+        return self._build_sound_index(self.sound_library)
+
+    @cached_property
+    def _autocomplete_index(self):
+        """Sorted (lowercase name, track) pairs for prefix autocomplete"""
+        return self._build_autocomplete_index(self.sound_library)
+
+    @cached_property
+    def _all_tracks(self):
+        """Flat track array across categories, parallel to _name_lower"""
+        return [track for tracks in self.sound_library.values() for track in tracks]
+
+    @cached_property
+    def _name_lower(self):
+        """Packed lowercase-name array for bulk filtering without attribute chasing"""
+        return [track.name.lower() for track in self._all_tracks]
+
+    def _invalidate_flat_arrays(self):
+        """Drop the cached flat arrays after a library mutation"""
+        self.__dict__.pop('_all_tracks', None)
+        self.__dict__.pop('_name_lower', None)
+
+    def search_sounds(self, text):
+        """Find tracks whose names contain the given text (case-insensitive)"""
+        text = text.lower()
+        tracks = self._all_tracks
+        return [tracks[i] for i, name in enumerate(self._name_lower) if text in name]
+
+    def _build_sound_index(self, library):
+        """Build the category -> lowercase name -> track lookup index"""
+        return {
+            category: {track.name.lower(): track for track in tracks}
+            for category, tracks in library.items()
+        }
+
+    def _build_autocomplete_index(self, library):
+        """Build a sorted cross-category name index for prefix autocomplete"""
+        index = [
+            (track.name.lower(), track)
+            for tracks in library.values()
+            for track in tracks
+        ]
+        index.sort(key=lambda pair: pair[0])
+        return index
+
+    def autocomplete(self, prefix, limit=25):
+        """Find tracks whose names start with the given prefix, across all categories"""
+        prefix = prefix.lower()
+
+        # Binary search for the start of the prefix range in the sorted index
+        start = bisect.bisect_left(self._autocomplete_index, (prefix,))
+
+        matches = []
+        for lower_name, track in self._autocomplete_index[start:start + limit]:
+            if not lower_name.startswith(prefix):
+                break
+            matches.append(track)
+
+        return matches
     
+    def _ensure_dir(self, directory):
+        """Create a directory once per session, skipping repeat syscalls"""
+        if directory not in self._ensured_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._ensured_dirs.add(directory)
+
+    def _load_index(self):
+        """Load the cached scan index from a previous startup"""
+        try:
+            if os.path.exists(INDEX_FILE):
+                with open(INDEX_FILE, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load audio index: {e}")
+        return {}
+
+    def _save_index(self, library):
+        """Persist the scan index so the next startup only re-stats changed files"""
+        try:
+            index = {
+                category: [
+                    {
+                        'name': track.name,
+                        'file_path': track.file_path,
+                        'mtime': track.mtime,
+                        'size': track.size,
+                        'duration': track.duration
+                    }
+                    for track in tracks
+                ]
+                for category, tracks in library.items()
+            }
+
+            with open(INDEX_FILE, 'w', encoding='utf-8') as f:
+                json.dump(index, f)
+        except Exception as e:
+            logger.warning(f"Could not save audio index: {e}")
+
+    def _scan_one_category(self, category, cached_entries):
+        """Scan one category directory and return its AudioTracks"""
+        tracks = []
+
+        category_dir = f"data/audio/soundboard/{category}"
+        self._ensure_dir(category_dir)
+
+        with os.scandir(category_dir) as it:
+            for entry in it:
+                # Only lowercase the short extension, not the whole filename
+                dot = entry.name.rfind('.')
+                if dot == -1 or entry.name[dot + 1:].lower() not in AUDIO_EXT_SET:
+                    continue
+
+                if entry.is_file(follow_symlinks=False):
+                    name = entry.name[:dot]
+                    stat = entry.stat(follow_symlinks=False)
+
+                    # Reuse the cached entry (with its duration) if unchanged
+                    cached = cached_entries.get(entry.path)
+                    if cached and cached.get('mtime') == stat.st_mtime_ns:
+                        duration = cached.get('duration', 0.0)
+                    else:
+                        duration = 0.0
+
+                    track = AudioTrack(
+                        name=name,
+                        category=category,
+                        file_path=entry.path,
+                        tags=[category.lower()],
+                        duration=duration,
+                        mtime=stat.st_mtime_ns,
+                        size=stat.st_size
+                    )
+
+                    tracks.append(track)
+
+        return tracks
+
     def _scan_audio_files(self):
         """Scan for audio files in soundboard directories"""
-        library = {}
-        
         try:
-            # Scan standard categories
+            # Cached entries from the last scan, keyed by path for quick reuse
+            cached_index = self._load_index()
+            cached_entries = {}
+            for entries in cached_index.values():
+                for cached in entries:
+                    cached_entries[cached['file_path']] = cached
+
+            # Scan standard categories in parallel; the scans are I/O-bound
             categories = ["Default", "Combat", "Ambience"]
-            for category in categories:
-                library[category] = []
-                
-                category_dir = f"data/audio/soundboard/{category}"
-                os.makedirs(category_dir, exist_ok=True)
-                
-                for file in os.listdir(category_dir):
-                    if file.lower().endswith(('.mp3', '.wav', '.ogg', '.flac')):
-                        file_path = os.path.join(category_dir, file)
-                        name = os.path.splitext(file)[0]
-                        
-                        track = AudioTrack(
-                            name=name,
-                            category=category,
-                            file_path=file_path,
-                            tags=[category.lower()]
-                        )
-                        
-                        library[category].append(track)
-            
+            with ThreadPoolExecutor(max_workers=min(8, len(categories))) as executor:
+                library = dict(zip(
+                    categories,
+                    executor.map(lambda c: self._scan_one_category(c, cached_entries), categories)
+                ))
+
             # Log found sounds
             total_sounds = sum(len(sounds) for sounds in library.values())
             logger.info(f"Found {total_sounds} sounds across {len(library)} categories")
-            
+
+            # Save the refreshed index for the next startup
+            self._save_index(library)
+
             return library
         except Exception as e:
             logger.error(f"Error scanning audio files: {e}")
             return {"Default": [], "Combat": [], "Ambience": []}
+
+    def refresh_library(self):
+        """Rescan the soundboard directories and rebuild the library"""
+        self.sound_library = self._scan_audio_files()
+        self._sound_index = self._build_sound_index(self.sound_library)
+        self._autocomplete_index = self._build_autocomplete_index(self.sound_library)
+        self._invalidate_flat_arrays()
+        return self.sound_library
     
     async def join_voice_channel(self, channel):
         """Join a voice channel"""
@@ -124,20 +302,30 @@ class AudioManager:
             return False
         
         try:
-            # Find sound in library
-            track = None
-            for sound in self.sound_library.get(category, []):
-                if sound.name.lower() == sound_name.lower():
-                    track = sound
-                    break
-            
+            # Hydrate the library off the event loop on first use
+            if 'sound_library' not in self.__dict__:
+                await asyncio.to_thread(lambda: self.sound_library)
+
+            # Find sound in the lookup index
+            track = self._sound_index.get(category, {}).get(sound_name.lower())
+
             if not track:
                 logger.warning(f"Sound {sound_name} in category {category} not found")
                 return False
             
-            # Create audio source
-            audio_source = discord.FFmpegPCMAudio(track.file_path)
-            
+            # Create audio source; small clips replay from a cached PCM
+            # buffer so repeat plays skip the ffmpeg subprocess spawn
+            audio_source = None
+            if 0 < track.size <= PCM_CACHE_MAX_FILE_SIZE:
+                try:
+                    pcm = await asyncio.to_thread(_decode_pcm, track.file_path, track.mtime)
+                    audio_source = discord.PCMAudio(io.BytesIO(pcm))
+                except Exception as decode_error:
+                    logger.warning(f"PCM cache decode failed for {track.file_path}: {decode_error}")
+
+            if audio_source is None:
+                audio_source = discord.FFmpegPCMAudio(track.file_path)
+
             # Apply volume
             audio_source = discord.PCMVolumeTransformer(audio_source, volume=0.5)
             
@@ -180,39 +368,78 @@ class AudioManager:
     
     def get_all_sounds(self):
         """Get all available sounds"""
-        all_sounds = []
-        for sounds in self.sound_library.values():
-            all_sounds.extend(sounds)
-        return all_sounds
+        return list(self._all_tracks)
     
+    def _transfer_file(self, src_path, dest_path):
+        """Move a file into the soundboard, cheaply when possible"""
+        try:
+            # Same-filesystem move is a metadata-only operation
+            os.rename(src_path, dest_path)
+            return
+        except OSError:
+            pass
+
+        # Cross-device: fall back to a zero-copy kernel transfer
+        try:
+            with open(src_path, 'rb') as src, open(dest_path, 'wb') as dst:
+                src_fd = src.fileno()
+                dst_fd = dst.fileno()
+                offset = 0
+                while True:
+                    sent = os.sendfile(dst_fd, src_fd, offset, 1 << 20)
+                    if sent == 0:
+                        break
+                    offset += sent
+        except (AttributeError, OSError):
+            # sendfile unavailable (e.g. Windows) or refused for this pair
+            shutil.copy2(src_path, dest_path)
+
     def add_custom_sound(self, guild_id, name, file_path, category="Default"):
         """Add a custom sound to the soundboard"""
         try:
-            # Check if file exists
-            if not os.path.exists(file_path):
-                logger.error(f"Sound file not found: {file_path}")
-                return False
-            
             # Ensure category directory exists
             category_dir = f"data/audio/soundboard/{category}"
-            os.makedirs(category_dir, exist_ok=True)
-            
-            # Copy file to sound directory
+            self._ensure_dir(category_dir)
+
+            # Hydrate the library and both derived indexes before the
+            # file lands in the category dir and before the library is
+            # mutated; building either lazily mid-add would pick the new
+            # sound up once itself and again from the insert below
+            index_bucket = self._sound_index.setdefault(category, {})
+            autocomplete_index = self._autocomplete_index
+
+            # Transfer file to the sound directory
             dest_path = f"{category_dir}/{name}{os.path.splitext(file_path)[1]}"
-            shutil.copy2(file_path, dest_path)
-            
-            # Create track
-            track = AudioTrack(
-                name=name,
-                category=category,
-                file_path=dest_path,
-                tags=[category.lower()]
-            )
-            
-            # Add to library
-            if category not in self.sound_library:
-                self.sound_library[category] = []
-            self.sound_library[category].append(track)
+            self._transfer_file(file_path, dest_path)
+
+            # The fresh mtime keys the PCM cache past any stale entry for
+            # a file this upload just replaced, and the size makes the
+            # new clip eligible for caching right away
+            stat = os.stat(dest_path)
+
+            track = index_bucket.get(name.lower())
+            if track is not None:
+                # Re-upload under an existing name: refresh the indexed
+                # track in place instead of inserting a duplicate
+                track.file_path = dest_path
+                track.mtime = stat.st_mtime_ns
+                track.size = stat.st_size
+                track.duration = 0.0
+            else:
+                track = AudioTrack(
+                    name=name,
+                    category=category,
+                    file_path=dest_path,
+                    tags=[category.lower()],
+                    mtime=stat.st_mtime_ns,
+                    size=stat.st_size
+                )
+
+                # Add to library and lookup index
+                self.sound_library.setdefault(category, []).append(track)
+                index_bucket[name.lower()] = track
+                bisect.insort(autocomplete_index, (name.lower(), track), key=lambda pair: pair[0])
+                self._invalidate_flat_arrays()
             
             logger.info(f"Added custom sound {name} to category {category}")
             return True
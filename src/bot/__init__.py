@@ -3,7 +3,6 @@ Bishop Bot - Bot Initialization
 Last updated: 2025-06-01 12:58:55 UTC by Bioku87
 """
 import os
-import sys
 import logging
 import asyncio
 import datetime
@@ -19,12 +18,142 @@ try:
     from .commands import register_commands
     logger.info("Successfully imported command registration")
 except ImportError as e:
-    logger.error(f"Could not import commands: {e}")
+    logger.error("Could not import commands: %s", e)
     # Define a stub function if the real one isn't available
     async def register_commands(bot):
         logger.warning("Using stub command registration")
         return False
 
+# Import the real component managers once at module load; main.py puts
+# src on sys.path before this module is imported. Each falls back to
+# None so _initialize_components can substitute a minimal stand-in.
+try:
+    from database.manager import DatabaseManager
+except ImportError as e:
+    logger.warning("Database manager import failed: %s", e)
+    DatabaseManager = None
+
+try:
+    from voice.manager import VoiceManager
+except ImportError as e:
+    logger.warning("Voice manager import failed: %s", e)
+    VoiceManager = None
+
+try:
+    from audio.manager import AudioManager
+except ImportError as e:
+    logger.warning("Audio manager not available: %s", e)
+    AudioManager = None
+
+# Welcome embed sent on guild join; built once since its content is static
+_WELCOME_EMBED = discord.Embed(
+    title="Thanks for adding Bishop Bot!",
+    description="Hello! I'm Bishop, a bot designed for tabletop RPG sessions with voice and audio features.",
+    color=discord.Color.blue()
+)
+_WELCOME_EMBED.add_field(
+    name="Getting Started",
+    value="Type `/help` to see available commands.",
+    inline=False
+)
+_WELCOME_EMBED.set_footer(text="Made by Bioku87")
+
+# Fallback components used when the real managers cannot be imported.
+# Defined at module scope so the class objects are built once at import
+# time instead of on every BishopBot construction.
+class MinimalDatabaseManager:
+    def get_value(self, key):
+        return None
+
+    def set_value(self, key, value):
+        return False
+
+    def close(self):
+        pass
+
+class MinimalVoiceManager:
+    def __init__(self):
+        self.voice_clients = {}
+        self.recording_sessions = {}
+
+    def get_connected_guilds(self):
+        return []
+
+    def is_connected(self, guild_id):
+        return False
+
+    def is_recording(self, guild_id):
+        return False
+
+    async def join_voice_channel(self, channel):
+        return False
+
+    async def disconnect_from_guild(self, guild_id):
+        return False
+
+    async def start_recording(self, guild_id):
+        return False
+
+    async def stop_recording(self, guild_id):
+        return False
+
+    async def get_session_transcripts(self, guild_id, session_id=None):
+        return []
+
+    async def read_transcript(self, path):
+        return "Transcript not available"
+
+class MinimalAudioManager:
+    def __init__(self, bot):
+        self.bot = bot
+        self.voice_clients = {}
+
+    async def play_sound(self, guild_id, sound_name, category="Default"):
+        return False
+
+    async def stop_playback(self, guild_id):
+        return False
+
+    def get_sounds_in_category(self, category):
+        return []
+
+    async def disconnect_from_guild(self, guild_id):
+        return False
+
+def _bootstrap_minimal_db(bot):
+    """Create a bare SQLite file and return the minimal database manager"""
+    db_path = "data/database"
+    os.makedirs(db_path, exist_ok=True)
+
+    # Create a simple SQLite DB file
+    import sqlite3
+    conn = sqlite3.connect(f"{db_path}/bishop.db")
+    cursor = conn.cursor()
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS bot_data (
+        key TEXT PRIMARY KEY,
+        value TEXT
+    )
+    ''')
+    conn.commit()
+    conn.close()
+
+    return MinimalDatabaseManager()
+
+# Component registration table:
+# (attribute, status key, real factory or None, fallback factory, fallback counts as initialized)
+_COMPONENTS = (
+    ('db', 'database',
+     (lambda bot: DatabaseManager()) if DatabaseManager else None,
+     _bootstrap_minimal_db, True),
+    ('voice_manager', 'voice',
+     (lambda bot: VoiceManager(bot)) if VoiceManager else None,
+     lambda bot: MinimalVoiceManager(), False),
+    ('audio_manager', 'audio',
+     (lambda bot: AudioManager(bot)) if AudioManager else None,
+     lambda bot: MinimalAudioManager(bot), False),
+)
+
 class BishopBot(discord_commands.Bot):
     """Main Bishop Bot class"""
     
@@ -52,163 +181,35 @@ class BishopBot(discord_commands.Bot):
         logger.info("BishopBot class initialized")
     
     def _initialize_components(self):
-        """Initialize bot components"""
-        # Initialize database component
-        try:
-            logger.info("Initializing database component...")
-            
-            # Add src directory to path to help with imports
-            src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-            if src_path not in sys.path:
-                sys.path.insert(0, src_path)
-                
+        """Initialize bot components from the registration table"""
+        for attr, key, factory, fallback, fallback_ok in _COMPONENTS:
             try:
-                from database.manager import DatabaseManager
-                
-                # Initialize the database
-                self.db = DatabaseManager()
-                self.initialized_components["database"] = True
-                
-                logger.info("Database component initialized successfully")
-            except ImportError as import_error:
-                logger.warning(f"Database manager import failed: {import_error}")
-                
-                # Create a minimal database
-                db_path = "data/database"
-                os.makedirs(db_path, exist_ok=True)
-                
-                # Create a simple SQLite DB file
-                import sqlite3
-                conn = sqlite3.connect(f"{db_path}/bishop.db")
-                cursor = conn.cursor()
-                cursor.execute('''
-                CREATE TABLE IF NOT EXISTS bot_data (
-                    key TEXT PRIMARY KEY,
-                    value TEXT
-                )
-                ''')
-                conn.commit()
-                conn.close()
-                
-                # Create a minimal database manager
-                class MinimalDatabaseManager:
-                    def get_value(self, key):
-                        return None
-                        
-                    def set_value(self, key, value):
-                        return False
-                        
-                    def close(self):
-                        pass
-                
-                self.db = MinimalDatabaseManager()
-                self.initialized_components["database"] = True
-                logger.info("Minimal database initialized")
-        except Exception as e:
-            logger.error(f"Error initializing database: {e}")
-            self.initialized_components["database"] = False
-        
-        # Initialize Voice Manager with ultra safe approach
-        try:
-            logger.info("Initializing voice manager...")
-            # Create a simple object with required methods if import fails
-            self.voice_manager = None
-            self.initialized_components["voice"] = False
-            
-            # Import the voice manager with manual exception handling
+                logger.info("Initializing %s component...", key)
+
+                if factory is not None:
+                    setattr(self, attr, factory(self))
+                    self.initialized_components[key] = True
+                    logger.info("%s component initialized successfully", key.capitalize())
+                    continue
+            except Exception as e:
+                logger.error("Error initializing %s component: %s", key, e)
+
+            # Install the minimal fallback implementation
             try:
-                # Add src directory to path to help with imports (if not added already)
-                src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-                if src_path not in sys.path:
-                    sys.path.insert(0, src_path)
-                    
-                # Try to import
-                from voice.manager import VoiceManager
-                
-                # Create instance with safe initialization
-                self.voice_manager = VoiceManager(self)
-                self.initialized_components["voice"] = True
-                logger.info("Voice manager initialized successfully")
-            except ImportError as e:
-                logger.warning(f"Voice manager import failed: {e}")
+                setattr(self, attr, fallback(self))
+                self.initialized_components[key] = fallback_ok
+                logger.info("Created fallback minimal %s component", key)
             except Exception as e:
-                logger.error(f"Error creating voice manager instance: {e}")
-        except Exception as e:
-            logger.error(f"Error in voice manager initialization block: {e}")
-            # Ensure voice_manager attribute exists even if everything fails
-            if not hasattr(self, 'voice_manager') or self.voice_manager is None:
-                class MinimalVoiceManager:
-                    def __init__(self):
-                        self.voice_clients = {}
-                        self.recording_sessions = {}
-                    
-                    def get_connected_guilds(self):
-                        return []
-                    
-                    def is_connected(self, guild_id):
-                        return False
-                    
-                    def is_recording(self, guild_id):
-                        return False
-                    
-                    async def join_voice_channel(self, channel):
-                        return False
-                        
-                    async def disconnect_from_guild(self, guild_id):
-                        return False
-                        
-                    async def start_recording(self, guild_id):
-                        return False
-                        
-                    async def stop_recording(self, guild_id):
-                        return False
-                        
-                    async def get_session_transcripts(self, guild_id, session_id=None):
-                        return []
-                        
-                    async def read_transcript(self, path):
-                        return "Transcript not available"
-                
-                self.voice_manager = MinimalVoiceManager()
-                self.initialized_components["voice"] = False
-                logger.info("Created fallback minimal voice manager")
-        
-        # Initialize Audio Manager
-        try:
-            logger.info("Initializing audio manager...")
-            # Audio manager import (using the path we already added)
-            from audio.manager import AudioManager
-            self.audio_manager = AudioManager(self)
-            self.initialized_components["audio"] = True
-            logger.info("Audio manager initialized successfully")
-        except ImportError as e:
-            logger.warning(f"Audio manager not available: {e}")
-            
-            # Create a minimal audio manager
-            class MinimalAudioManager:
-                def __init__(self, bot):
-                    self.bot = bot
-                    self.voice_clients = {}
-                    
-                async def play_sound(self, guild_id, sound_name, category="Default"):
-                    return False
-                    
-                async def stop_playback(self, guild_id):
-                    return False
-                    
-                def get_sounds_in_category(self, category):
-                    return []
-                    
-                async def disconnect_from_guild(self, guild_id):
-                    return False
-            
-            self.audio_manager = MinimalAudioManager(self)
-            self.initialized_components["audio"] = False
-            logger.info("Created fallback minimal audio manager")
-        except Exception as e:
-            logger.error(f"Error initializing audio manager: {e}")
-            self.audio_manager = None
-            self.initialized_components["audio"] = False
+                logger.error("Error installing %s fallback: %s", key, e)
+                setattr(self, attr, None)
+                self.initialized_components[key] = False
+
+        # Components only change state here, so render the /info status
+        # string once instead of on every command invocation
+        self.components_status_str = "\n".join(
+            f"{component.capitalize()}: {'✅' if status else '❌'}"
+            for component, status in self.initialized_components.items()
+        )
     
     async def setup_hook(self):
         """Set up the bot before connecting to Discord"""
@@ -221,7 +222,7 @@ class BishopBot(discord_commands.Bot):
             # happens because we try to set presence before the bot is connected
             logger.info("Bot setup completed - will set presence after connection")
         except Exception as e:
-            logger.error(f"Error in setup_hook: {e}")
+            logger.error("Error in setup_hook: %s", e)
             logger.error("Bot will continue with limited functionality")
     
     async def on_ready(self):
@@ -238,14 +239,14 @@ class BishopBot(discord_commands.Bot):
             await self.change_presence(activity=activity, status=discord.Status.online)
             logger.info("Bot presence set successfully")
         except Exception as e:
-            logger.error(f"Error setting bot presence in on_ready: {e}")
+            logger.error("Error setting bot presence in on_ready: %s", e)
         
-        logger.info(f"Connected as {self.user} (ID: {self.user.id})")
-        logger.info(f"Connected to {len(self.guilds)} guilds")
+        logger.info("Connected as %s (ID: %s)", self.user, self.user.id)
+        logger.info("Connected to %s guilds", len(self.guilds))
         
         # Log guild information
         for guild in self.guilds:
-            logger.info(f"Connected to guild: {guild.name} (ID: {guild.id})")
+            logger.info("Connected to guild: %s (ID: %s)", guild.name, guild.id)
             
         print(f"\nBishop Bot is ready! Connected as {self.user}")
         print(f"Connected to {len(self.guilds)} guilds")
@@ -256,24 +257,17 @@ class BishopBot(discord_commands.Bot):
         try:
             # If the bot is left alone in a voice channel, leave
             if before.channel is not None and member.id != self.user.id:
-                # Check if bot is in the channel
-                bot_in_channel = False
-                for m in before.channel.members:
-                    if m.id == self.user.id:
-                        bot_in_channel = True
-                        break
-                
-                if bot_in_channel:
-                    # Check if alone
-                    alone = True
-                    for m in before.channel.members:
-                        if not m.bot and m.id != self.user.id:
-                            alone = False
-                            break
-                    
+                members = before.channel.members
+                bot_id = self.user.id
+
+                # Check if bot is in the channel (short-circuits on first hit)
+                if any(m.id == bot_id for m in members):
+                    # Check if any human is still present
+                    alone = not any(not m.bot and m.id != bot_id for m in members)
+
                     # Disconnect if alone
                     if alone:
-                        logger.info(f"Left alone in voice channel {before.channel.name}, disconnecting")
+                        logger.info("Left alone in voice channel %s, disconnecting", before.channel.name)
                         
                         # Disconnect voice manager
                         if hasattr(self, 'voice_manager') and self.voice_manager:
@@ -283,7 +277,7 @@ class BishopBot(discord_commands.Bot):
                         if hasattr(self, 'audio_manager') and self.audio_manager:
                             await self.audio_manager.disconnect_from_guild(before.channel.guild.id)
         except Exception as e:
-            logger.error(f"Error in voice state update: {e}")
+            logger.error("Error in voice state update: %s", e)
     
     async def on_application_command_error(self, interaction, error):
         """Handle errors in slash commands"""
@@ -299,7 +293,7 @@ class BishopBot(discord_commands.Bot):
                     ephemeral=True
                 )
             else:
-                logger.error(f"Command error: {error}")
+                logger.error("Command error: %s", error)
                 # Try to send an error message if possible
                 try:
                     if interaction.response.is_done():
@@ -315,66 +309,90 @@ class BishopBot(discord_commands.Bot):
                 except:
                     pass
         except Exception as e:
-            logger.error(f"Error handling command error: {e}")
+            logger.error("Error handling command error: %s", e)
     
     async def on_message(self, message):
         """Process messages for prefix commands if needed"""
         # Don't respond to our own messages
         if message.author.id == self.user.id:
             return
-        
+
+        # Skip the command parser unless the message could be a prefix command
+        if not message.content or not message.content.startswith(self.command_prefix):
+            return
+
         # Process commands for legacy prefix commands if needed
         await self.process_commands(message)
     
     async def on_guild_join(self, guild):
         """Handle joining a new guild"""
-        logger.info(f"Joined new guild: {guild.name} (ID: {guild.id})")
+        logger.info("Joined new guild: %s (ID: %s)", guild.name, guild.id)
         
         # Send welcome message to the first available text channel
         try:
-            for channel in guild.text_channels:
-                if channel.permissions_for(guild.me).send_messages:
-                    embed = discord.Embed(
-                        title="Thanks for adding Bishop Bot!",
-                        description="Hello! I'm Bishop, a bot designed for tabletop RPG sessions with voice and audio features.",
-                        color=discord.Color.blue()
-                    )
-                    embed.add_field(
-                        name="Getting Started",
-                        value="Type `/help` to see available commands.",
-                        inline=False
-                    )
-                    embed.set_footer(text="Made by Bioku87")
-                    
-                    await channel.send(embed=embed)
-                    break
+            channel = next(
+                (c for c in guild.text_channels if c.permissions_for(guild.me).send_messages),
+                None
+            )
+            if channel:
+                await channel.send(embed=_WELCOME_EMBED)
         except Exception as e:
-            logger.error(f"Error sending welcome message to guild {guild.name}: {e}")
+            logger.error("Error sending welcome message to guild %s: %s", guild.name, e)
     
     def get_uptime(self):
         """Get the bot's uptime as a string"""
-        delta = discord.utils.utcnow() - self.start_time
-        hours, remainder = divmod(int(delta.total_seconds()), 3600)
-        minutes, seconds = divmod(remainder, 60)
-        days, hours = divmod(hours, 24)
-        
+        total = int((discord.utils.utcnow() - self.start_time).total_seconds())
+        days, rem = divmod(total, 86400)
+        hours, rem = divmod(rem, 3600)
+        minutes, seconds = divmod(rem, 60)
+
         if days:
             return f"{days}d {hours}h {minutes}m {seconds}s"
         else:
             return f"{hours}h {minutes}m {seconds}s"
     
-    def close(self):
+    async def close(self):
         """Properly close the bot and its components"""
+        # Flush any settings writes still sitting in the debounce window
+        if hasattr(self, 'db') and self.db:
+            try:
+                from .commands.admin_commands import flush_settings_now
+                await flush_settings_now(self.db)
+            except Exception as e:
+                logger.error("Error flushing pending settings: %s", e)
+
+        # Flush character changes still in their debounce window; the
+        # import is lazy because the characters package may fail to load
+        try:
+            from characters import character_manager
+            await character_manager.shutdown()
+        except Exception as e:
+            logger.error("Error flushing pending character data: %s", e)
+
         # Close database if available
         if hasattr(self, 'db') and self.db:
             try:
                 self.db.close()
                 logger.info("Database closed")
             except Exception as e:
-                logger.error(f"Error closing database: {e}")
-        
+                logger.error("Error closing database: %s", e)
+
+        # Disconnect voice and audio managers concurrently
+        try:
+            disconnects = []
+            for manager in (getattr(self, 'voice_manager', None), getattr(self, 'audio_manager', None)):
+                if manager:
+                    for guild_id in list(getattr(manager, 'voice_clients', {})):
+                        disconnects.append(manager.disconnect_from_guild(guild_id))
+
+            if disconnects:
+                await asyncio.gather(*disconnects, return_exceptions=True)
+                logger.info("Voice connections closed")
+        except Exception as e:
+            logger.error("Error disconnecting voice clients: %s", e)
+
         # Call parent close method
-        super().close()
+        await super().close()
 
 # Export the BishopBot class
 __all__ = ['BishopBot']
\ No newline at end of file
@@ -2,188 +2,338 @@
 Bishop Bot - Admin Commands
 Last updated: 2025-05-31 19:08:32 UTC by Bioku87
 """
+import asyncio
+import datetime
 import discord
+import json
 import logging
 import os
+import shutil
+import sqlite3
+import subprocess
+import sys
 from discord import app_commands
 from discord.ext import commands
 
+from .registration import defer_first
+
 logger = logging.getLogger('bishop_bot.commands.admin')
 
-async def register_admin_commands(bot):
-    """Register admin-related commands"""
-    
-    # Check admin permission
-    def is_admin():
-        def predicate(interaction: discord.Interaction):
-            return interaction.user.guild_permissions.administrator
-        return app_commands.check(predicate)
-    
-    @bot.tree.command(name="setup", description="Set up the bot for this server")
-    @is_admin()
-    async def setup_command(interaction: discord.Interaction):
-        try:
-            await interaction.response.defer(ephemeral=True)
-            
-            # Create server directory structure
-            guild_id = interaction.guild.id
-            
-            # Create guild-specific directories
-            directories = [
-                f"data/audio/soundboard/{guild_id}",
-                f"data/characters/{guild_id}",
-                f"data/voice/sessions/{guild_id}"
-            ]
-            
+# Parsed guild settings, keyed by guild_id string; settings only change
+# through /setsetting and /setup, which update the cache themselves
+_settings_cache = {}
+
+# Debounced settings writer: consecutive /setsetting calls within the
+# window are merged and flushed in one executemany transaction
+_FLUSH_DELAY = 0.25
+_pending_writes = {}  # guild_id -> settings dict (shared with the cache)
+_flush_task = None
+
+_SETTINGS_UPSERT = (
+    "INSERT OR REPLACE INTO guild_settings (guild_id, settings, updated_at) "
+    "VALUES (?, ?, ?)"
+)
+
+async def _write_pending(db):
+    """Write out everything currently queued in one batched transaction"""
+    pending = dict(_pending_writes)
+    _pending_writes.clear()
+    if not pending:
+        return
+
+    now = datetime.datetime.now().isoformat()
+    params = [
+        (guild_id, json.dumps(settings), now)
+        for guild_id, settings in pending.items()
+    ]
+    try:
+        await asyncio.to_thread(db.executemany, _SETTINGS_UPSERT, params)
+    except Exception as e:
+        logger.error(f"Error flushing settings updates: {e}")
+
+async def _flush_settings(db):
+    """Flush pending settings updates, looping until the queue is drained
+
+    Writes that land while a flush is in progress are picked up by the
+    next loop iteration, so nothing can be stranded in the queue; the
+    task only finishes when it observes an empty queue with no awaits
+    between the check and its completion.
+    """
+    while True:
+        await asyncio.sleep(_FLUSH_DELAY)
+        await _write_pending(db)
+        if not _pending_writes:
+            return
+
+def _queue_settings_write(db, guild_id, settings):
+    """Queue a settings write, starting the flusher if it is not running"""
+    global _flush_task
+    _pending_writes[guild_id] = settings
+    if _flush_task is None or _flush_task.done():
+        _flush_task = asyncio.create_task(_flush_settings(db))
+
+async def flush_settings_now(db):
+    """Flush any queued settings writes immediately (used at shutdown)"""
+    global _flush_task
+    if _flush_task is not None and not _flush_task.done():
+        _flush_task.cancel()
+    await _write_pending(db)
+
+async def _get_settings(db, guild_id):
+    """Return the parsed settings dict for a guild, caching across commands.
+
+    Cache hits never touch the event loop; misses run the query in a
+    worker thread so concurrent interactions are not serialized on sqlite.
+    """
+    key = str(guild_id)
+    settings = _settings_cache.get(key)
+    if settings is not None:
+        return settings
+
+    settings = await asyncio.to_thread(db.get_guild_settings, guild_id)
+    if not settings:
+        return None
+
+    _settings_cache[key] = settings
+    return settings
+
+def _is_admin_predicate(interaction: discord.Interaction):
+    """Shared admin check used by every admin command"""
+    return interaction.user.guild_permissions.administrator
+
+_admin_check = app_commands.check(_is_admin_predicate)
+
+def _fast_copy(src, dst):
+    """Copy a file using the cheapest mechanism available.
+
+    Tries a hardlink first (O(1), no data copied), then a reflink copy on
+    Linux (copy-on-write on BTRFS/XFS), and finally a buffered byte copy.
+    """
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+
+    if sys.platform.startswith('linux'):
+        result = subprocess.run(['cp', '--reflink=auto', '--preserve=timestamps', src, dst],
+                                capture_output=True)
+        if result.returncode == 0:
+            return
+
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        shutil.copyfileobj(fsrc, fdst, length=4 * 1024 * 1024)
+    shutil.copystat(src, dst)
+
+def _snapshot_tree(src_dir, dst_dir):
+    """Snapshot a directory tree into dst_dir using _fast_copy per file"""
+    copied = 0
+    for root, dirs, files in os.walk(src_dir):
+        rel = os.path.relpath(root, src_dir)
+        target = os.path.join(dst_dir, rel) if rel != '.' else dst_dir
+        os.makedirs(target, exist_ok=True)
+        for name in files:
+            _fast_copy(os.path.join(root, name), os.path.join(target, name))
+            copied += 1
+    return copied
+
+@app_commands.command(name="setup", description="Set up the bot for this server")
+@_admin_check
+async def setup_command(interaction: discord.Interaction):
+    try:
+        await interaction.response.defer(ephemeral=True)
+        db = getattr(interaction.client, 'db', None)
+        
+        # Create server directory structure
+        guild_id = interaction.guild.id
+        
+        # Create guild-specific directories
+        directories = [
+            f"data/audio/soundboard/{guild_id}",
+            f"data/characters/{guild_id}",
+            f"data/voice/sessions/{guild_id}"
+        ]
+        
+        def _make_dirs():
+            # On the common re-setup path everything exists: one isdir
+            # per directory and no mkdir calls at all
             for directory in directories:
-                os.makedirs(directory, exist_ok=True)
-            
-            # Create or load guild settings
-            guild_settings = {}
-            try:
-                if hasattr(bot, 'db'):
-                    result = bot.db.fetchone("SELECT settings FROM guild_settings WHERE guild_id = ?", (str(guild_id),))
-                    if result and 'settings' in result:
-                        import json
-                        guild_settings = json.loads(result['settings'])
-                    else:
-                        # Create default settings
-                        guild_settings = {
-                            "prefix": "/",
-                            "welcome_channel": None,
-                            "admin_role": None,
-                            "voice_recognition_enabled": True,
-                            "default_volume": 0.5
-                        }
-                        
-                        # Save settings
-                        bot.db.insert('guild_settings', {
-                            'guild_id': str(guild_id),
-                            'settings': json.dumps(guild_settings)
-                        })
-            except Exception as e:
-                logger.error(f"Error loading guild settings: {e}")
-            
-            await interaction.followup.send(
-                "Bishop Bot set up for this server. Use `/settings` to configure settings."
-            )
-        except Exception as e:
-            logger.error(f"Error in setup command: {e}")
-            await interaction.followup.send("An error occurred during setup.")
-    
-    @bot.tree.command(name="settings", description="Configure bot settings")
-    @is_admin()
-    async def settings_command(interaction: discord.Interaction):
-        try:
-            # Check if database exists
-            if not hasattr(bot, 'db'):
-                await interaction.response.send_message("Settings management is not available.", ephemeral=True)
-                return
-            
-            # Get current settings
-            guild_id = interaction.guild.id
-            result = bot.db.fetchone("SELECT settings FROM guild_settings WHERE guild_id = ?", (str(guild_id),))
-            
-            if not result:
-                await interaction.response.send_message("Please run `/setup` first.", ephemeral=True)
-                return
-            
-            # Parse settings
-            import json
-            settings = json.loads(result['settings'])
-            
-            # Create embed response
-            embed = discord.Embed(
-                title="Server Settings",
-                description="Current settings for this server",
-                color=discord.Color.blue()
-            )
-            
-            for key, value in settings.items():
-                embed.add_field(
-                    name=key,
-                    value=str(value),
-                    inline=True
-                )
-            
-            # Add instructions
-            embed.add_field(
-                name="How to Change Settings",
-                value="Use `/setsetting key value` to change a setting",
-                inline=False
-            )
-            
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-        except Exception as e:
-            logger.error(f"Error in settings command: {e}")
-            await interaction.response.send_message("An error occurred while getting settings.", ephemeral=True)
-    
-    @bot.tree.command(name="setsetting", description="Change a bot setting")
-    @app_commands.describe(
-        key="Setting key",
-        value="Setting value"
-    )
-    @is_admin()
-    async def set_setting_command(interaction: discord.Interaction, key: str, value: str):
+                if not os.path.isdir(directory):
+                    os.makedirs(directory, exist_ok=True)
+
+        await asyncio.to_thread(_make_dirs)
+        
+        # Create or load guild settings
         try:
-            # Check if database exists
-            if not hasattr(bot, 'db'):
-                await interaction.response.send_message("Settings management is not available.", ephemeral=True)
-                return
-            
-            # Get current settings
-            guild_id = interaction.guild.id
-            result = bot.db.fetchone("SELECT settings FROM guild_settings WHERE guild_id = ?", (str(guild_id),))
-            
-            if not result:
-                await interaction.response.send_message("Please run `/setup` first.", ephemeral=True)
-                return
-            
-            # Parse settings
-            import json
-            settings = json.loads(result['settings'])
-            
-            # Update setting
-            settings[key] = value
-            
-            # Save settings
-            bot.db.update('guild_settings', {
-                'settings': json.dumps(settings),
-                'updated_at': 'CURRENT_TIMESTAMP'
-            }, 'guild_id = ?', (str(guild_id),))
-            
-            await interaction.response.send_message(f"Setting updated: {key} = {value}", ephemeral=True)
+            if db is not None:
+                guild_settings = await _get_settings(db, guild_id)
+                if guild_settings is None:
+                    # Create default settings
+                    guild_settings = {
+                        "prefix": "/",
+                        "welcome_channel": None,
+                        "admin_role": None,
+                        "voice_recognition_enabled": True,
+                        "default_volume": 0.5
+                    }
+                    
+                    # Save settings and seed the cache
+                    await asyncio.to_thread(db.save_guild_settings, guild_id, guild_settings)
+                    _settings_cache[str(guild_id)] = guild_settings
         except Exception as e:
-            logger.error(f"Error in set_setting command: {e}")
-            await interaction.response.send_message("An error occurred while updating the setting.", ephemeral=True)
-    
-    @bot.tree.command(name="backup", description="Backup bot data")
-    @is_admin()
-    async def backup_command(interaction: discord.Interaction):
-        try:
-            await interaction.response.defer(ephemeral=True)
-            
-            # Create backup directory
-            import datetime
-            import shutil
-            
-            backup_dir = "data/backups"
-            os.makedirs(backup_dir, exist_ok=True)
-            
-            # Create timestamp
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            logger.error(f"Error loading guild settings: {e}")
+        
+        await interaction.followup.send(
+            "Bishop Bot set up for this server. Use `/settings` to configure settings."
+        )
+    except Exception as e:
+        logger.error(f"Error in setup command: {e}")
+        await interaction.followup.send("An error occurred during setup.")
+
+@app_commands.command(name="settings", description="Configure bot settings")
+@_admin_check
+@defer_first(ephemeral=True)
+async def settings_command(interaction: discord.Interaction):
+    try:
+        # Check if database exists
+        db = getattr(interaction.client, 'db', None)
+        if db is None:
+            await interaction.followup.send("Settings management is not available.", ephemeral=True)
+            return
+        
+        # Get current settings (cached after the first read)
+        guild_id = interaction.guild.id
+        settings = await _get_settings(db, guild_id)
+        
+        if settings is None:
+            await interaction.followup.send("Please run `/setup` first.", ephemeral=True)
+            return
+        
+        # Create embed response; bulk-build the fields rather than one
+        # add_field call (with its limit validation) per setting
+        fields = [
+            {"name": key, "value": str(value), "inline": True}
+            for key, value in settings.items()
+        ]
+        fields.append({
+            "name": "How to Change Settings",
+            "value": "Use `/setsetting key value` to change a setting",
+            "inline": False
+        })
+        embed = discord.Embed.from_dict({
+            "title": "Server Settings",
+            "description": "Current settings for this server",
+            "color": discord.Color.blue().value,
+            "fields": fields
+        })
+        
+        await interaction.followup.send(embed=embed, ephemeral=True)
+    except Exception as e:
+        logger.error(f"Error in settings command: {e}")
+        await interaction.followup.send("An error occurred while getting settings.", ephemeral=True)
+
+@app_commands.command(name="setsetting", description="Change a bot setting")
+@app_commands.describe(
+    key="Setting key",
+    value="Setting value"
+)
+@_admin_check
+@defer_first(ephemeral=True)
+async def set_setting_command(interaction: discord.Interaction, key: str, value: str):
+    try:
+        # Check if database exists
+        db = getattr(interaction.client, 'db', None)
+        if db is None:
+            await interaction.followup.send("Settings management is not available.", ephemeral=True)
+            return
+        
+        # Get current settings (cached after the first read)
+        guild_id = interaction.guild.id
+        settings = await _get_settings(db, guild_id)
+        
+        if settings is None:
+            await interaction.followup.send("Please run `/setup` first.", ephemeral=True)
+            return
+        
+        # Update setting; the cached dict is updated in place, so reads
+        # see the new value immediately while the write is debounced
+        settings[key] = value
+        _queue_settings_write(db, guild_id, settings)
+        
+        await interaction.followup.send(f"Setting updated: {key} = {value}", ephemeral=True)
+    except Exception as e:
+        logger.error(f"Error in set_setting command: {e}")
+        await interaction.followup.send("An error occurred while updating the setting.", ephemeral=True)
+
+@app_commands.command(name="backup", description="Backup bot data")
+@_admin_check
+async def backup_command(interaction: discord.Interaction):
+    try:
+        await interaction.response.defer(ephemeral=True)
+        db = getattr(interaction.client, 'db', None)
+        
+        # Create backup directory
+        backup_dir = "data/backups"
+        await asyncio.to_thread(os.makedirs, backup_dir, exist_ok=True)
+        
+        # Create timestamp
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        
+        # Backup database using SQLite's online backup API: safe under
+        # concurrent writers and copies pages without a userspace loop
+        if db is not None and hasattr(db, 'db_path'):
+            db_backup = f"{backup_dir}/bishop_db_{timestamp}.sqlite"
+
+            def _backup():
+                try:
+                    source = sqlite3.connect(f"file:{db.db_path}?mode=ro", uri=True)
+                    dest = sqlite3.connect(db_backup)
+                    try:
+                        source.backup(dest, pages=1024)
+                        return
+                    finally:
+                        dest.close()
+                        source.close()
+                except sqlite3.Error as e:
+                    logger.warning(f"Online backup failed, falling back to file copy: {e}")
+
+                # Plain copy fallback with a 4 MiB buffer; the default
+                # copyfileobj buffer costs far more syscalls on large DBs
+                with open(db.db_path, 'rb') as fsrc, open(db_backup, 'wb') as fdst:
+                    shutil.copyfileobj(fsrc, fdst, length=4 * 1024 * 1024)
+                shutil.copystat(db.db_path, db_backup)
+
+            await asyncio.to_thread(_backup)
+
+            # Snapshot guild asset trees; hardlinks make this near-free
+            def _snapshot_assets():
+                total = 0
+                for asset_dir in ("data/audio/soundboard", "data/characters", "data/voice/sessions"):
+                    if os.path.isdir(asset_dir):
+                        dst = f"{backup_dir}/{os.path.basename(asset_dir)}_{timestamp}"
+                        total += _snapshot_tree(asset_dir, dst)
+                return total
+
+            copied = await asyncio.to_thread(_snapshot_assets)
             
-            # Backup database
-            if hasattr(bot, 'db') and hasattr(bot.db, 'db_path'):
-                db_backup = f"{backup_dir}/bishop_db_{timestamp}.sqlite"
-                shutil.copy2(bot.db.db_path, db_backup)
-                
-                await interaction.followup.send(f"Database backed up to {db_backup}")
-            else:
-                await interaction.followup.send("Database backup not available.")
-        except Exception as e:
-            logger.error(f"Error in backup command: {e}")
-            await interaction.followup.send("An error occurred while creating a backup.")
+            await interaction.followup.send(f"Database backed up to {db_backup} ({copied} asset files snapshotted)")
+        else:
+            await interaction.followup.send("Database backup not available.")
+    except Exception as e:
+        logger.error(f"Error in backup command: {e}")
+        await interaction.followup.send("An error occurred while creating a backup.")
+
+async def register_admin_commands(bot):
+    """Register admin-related commands"""
+    # Handlers are defined once at module scope; registration is just
+    # adding the prebuilt command objects to the tree
+    for command in (
+        setup_command,
+        settings_command,
+        set_setting_command,
+        backup_command,
+    ):
+        bot.tree.add_command(command)
     
     logger.info("Admin commands registered")
     return True
\ No newline at end of file
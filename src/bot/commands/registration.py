@@ -0,0 +1,678 @@
+"""
+Bishop Bot - Command Registration
+Last updated: 2025-06-01 06:15:40 UTC by Bioku87
+"""
+import logging
+import discord
+from discord import app_commands
+from typing import List, Optional, Dict, Any
+import os
+import json
+import asyncio
+import hashlib
+import functools
+import time
+from itertools import islice
+
+logger = logging.getLogger('bishop_bot.commands')
+
+# Registered command names; a set for O(1) membership checks
+registered_commands = set()
+
+def defer_first(ephemeral=True):
+    """Defer the interaction before the command body runs.
+
+    Guarantees the 3-second acknowledgement window is met even when the
+    event loop is momentarily busy; bodies then use followup.send.
+    """
+    def decorator(coro):
+        @functools.wraps(coro)
+        async def wrapper(interaction: discord.Interaction, *args, **kwargs):
+            try:
+                await interaction.response.defer(ephemeral=ephemeral)
+            except discord.errors.InteractionResponded:
+                pass
+            return await coro(interaction, *args, **kwargs)
+        return wrapper
+    return decorator
+
+# Common ephemeral-deferred form used by most commands
+deferred_ephemeral = defer_first()
+
+def require_manager(attr, unavailable_message):
+    """Short-circuit a command when a bot component is unavailable.
+
+    _initialize_components always sets the manager attributes, so a
+    single truthiness check replaces the per-command hasattr guards.
+    """
+    def decorator(coro):
+        @functools.wraps(coro)
+        async def wrapper(interaction: discord.Interaction, *args, **kwargs):
+            if not getattr(interaction.client, attr, None):
+                await interaction.response.send_message(unavailable_message, ephemeral=True)
+                return
+            return await coro(interaction, *args, **kwargs)
+        return wrapper
+    return decorator
+
+require_voice = require_manager('voice_manager', "Voice features are not currently available.")
+require_audio = require_manager('audio_manager', "Audio features are not currently available.")
+
+# Hash of the last-synced command tree; sync is skipped when unchanged
+COMMAND_HASH_FILE = "data/.command_hash"
+
+def _command_tree_hash(bot):
+    """Compute a stable hash of the locally registered command definitions"""
+    spec = []
+    for cmd in bot.tree.get_commands():
+        params = [
+            (p.name, p.description, str(p.type), p.required)
+            for p in getattr(cmd, 'parameters', [])
+        ]
+        spec.append((cmd.name, cmd.description, params))
+    spec.sort()
+
+    payload = json.dumps(spec, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+def _load_command_hash():
+    """Load the hash recorded after the last successful sync"""
+    try:
+        with open(COMMAND_HASH_FILE, 'r', encoding='utf-8') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def _save_command_hash(tree_hash):
+    """Record the hash of the command tree that was just synced"""
+    try:
+        with open(COMMAND_HASH_FILE, 'w', encoding='utf-8') as f:
+            f.write(tree_hash)
+    except OSError as e:
+        logger.warning("Could not save command hash: %s", e)
+
+# Soundboard layout on disk
+SOUNDBOARD_DIR = "data/audio/soundboard"
+AUDIO_EXTS = frozenset({'mp3', 'wav', 'ogg', 'flac'})
+
+# Directory listing cache, invalidated by directory mtime
+_soundboard_root = (0, [])  # (root mtime_ns, [categories])
+_soundboard_cache = {}  # category -> (dir mtime_ns, [sound names], [embed field values])
+
+def _sound_field_values(names, group_size=20):
+    """Pre-join sorted sound names into embed field values of group_size each"""
+    it = iter(names)
+    values = []
+    while True:
+        group = list(islice(it, group_size))
+        if not group:
+            break
+        values.append("• " + "\n• ".join(group))
+    return values
+
+def _get_soundboard_index():
+    """Return (categories, sounds by category, embed field values by category),
+    rescanning only changed directories"""
+    global _soundboard_root
+
+    try:
+        root_stat = os.stat(SOUNDBOARD_DIR)
+    except OSError:
+        return [], {}, {}
+
+    root_mtime, categories = _soundboard_root
+    if root_stat.st_mtime_ns != root_mtime:
+        with os.scandir(SOUNDBOARD_DIR) as it:
+            categories = [entry.name for entry in it if entry.is_dir()]
+        _soundboard_root = (root_stat.st_mtime_ns, categories)
+
+    sounds_by_category = {}
+    fields_by_category = {}
+    for category in categories:
+        category_dir = f"{SOUNDBOARD_DIR}/{category}"
+        try:
+            category_stat = os.stat(category_dir)
+        except OSError:
+            continue
+
+        cached = _soundboard_cache.get(category)
+        if cached and cached[0] == category_stat.st_mtime_ns:
+            sounds_by_category[category] = cached[1]
+            fields_by_category[category] = cached[2]
+            continue
+
+        with os.scandir(category_dir) as it:
+            names = sorted(
+                entry.name.rsplit('.', 1)[0]
+                for entry in it
+                if entry.name.rpartition('.')[2].lower() in AUDIO_EXTS and entry.is_file()
+            )
+
+        field_values = _sound_field_values(names)
+        _soundboard_cache[category] = (category_stat.st_mtime_ns, names, field_values)
+        sounds_by_category[category] = names
+        fields_by_category[category] = field_values
+
+    return categories, sounds_by_category, fields_by_category
+
+# Transcript listings, coalesced per guild: concurrent callers share one
+# in-flight scan, and a short TTL covers /transcripts -> /readtranscript
+_TRANSCRIPTS_TTL = 30.0
+_transcripts_inflight = {}  # guild_id -> asyncio.Task
+_transcripts_cache = {}  # guild_id -> [monotonic timestamp, transcripts, embed or None]
+
+async def _get_transcripts(voice_manager, guild_id):
+    """Fetch session transcripts for a guild, sharing in-flight scans"""
+    now = time.monotonic()
+    cached = _transcripts_cache.get(guild_id)
+    if cached and now - cached[0] < _TRANSCRIPTS_TTL:
+        return cached[1]
+
+    task = _transcripts_inflight.get(guild_id)
+    if task is None:
+        task = asyncio.create_task(voice_manager.get_session_transcripts(guild_id))
+        _transcripts_inflight[guild_id] = task
+        try:
+            transcripts = await task
+            _transcripts_cache[guild_id] = [now, transcripts, None]
+            return transcripts
+        finally:
+            _transcripts_inflight.pop(guild_id, None)
+
+    return await task
+
+def _invalidate_transcripts_cache(guild_id):
+    """Drop the cached listing so the next /transcripts rescans disk"""
+    _transcripts_cache.pop(guild_id, None)
+
+def _transcripts_embed(guild_id, transcripts):
+    """Build the /transcripts embed, reusing the cached one until TTL expiry"""
+    cached = _transcripts_cache.get(guild_id)
+    if cached and cached[1] is transcripts and cached[2] is not None:
+        return cached[2]
+
+    embed = discord.Embed(
+        title="Available Transcripts",
+        description="Use `/readtranscript <number>` to read a transcript.",
+        color=discord.Color.blue()
+    )
+
+    for i, transcript in enumerate(transcripts[:10]):  # Show at most 10
+        name = f"{i+1}. {transcript['date']}"
+        value = f"File: {transcript['filename']}"
+        embed.add_field(name=name, value=value, inline=False)
+
+    if len(transcripts) > 10:
+        embed.set_footer(text=f"Showing 10 of {len(transcripts)} transcripts.")
+
+    # Embeds are not mutated by send, so the instance is safe to share
+    if cached and cached[1] is transcripts:
+        cached[2] = embed
+
+    return embed
+
+async def register_commands(bot):
+    """Register all bot commands with Discord"""
+    logger.info("Registering bot commands...")
+    
+    # Define and register every command from the declarative table while
+    # the soundboard directory cache warms up in a worker thread; TaskGroup
+    # joins both and aggregates any exceptions
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(asyncio.to_thread(_register_all_commands, bot))
+        tg.create_task(asyncio.to_thread(_get_soundboard_index))
+    
+    # Sync commands with Discord, skipping the round trip when the
+    # definitions are identical to the last successful sync
+    try:
+        tree_hash = _command_tree_hash(bot)
+    except Exception as e:
+        logger.warning("Could not hash command tree: %s", e)
+        tree_hash = None
+
+    if tree_hash is not None and tree_hash == _load_command_hash():
+        logger.info("Commands unchanged, skipping sync")
+        return True
+
+    # Sync in the background: the local dispatcher already serves commands,
+    # only Discord's UI listing depends on the round trip completing
+    logger.info("Syncing commands with Discord...")
+
+    def _on_sync_done(task):
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            logger.error("Command sync failed: %s", task.exception())
+            return
+        logger.info("Command sync complete!")
+        if tree_hash is not None:
+            _save_command_hash(tree_hash)
+
+    sync_task = asyncio.create_task(bot.tree.sync())
+    sync_task.add_done_callback(_on_sync_done)
+    bot.command_sync_task = sync_task
+
+    return True
+
+# Help embed, generated from the command table during registration so the
+# listed commands can never drift from what is actually registered
+_help_embed = None
+
+def _build_help_embed(command_table):
+    """Build the /help embed from the command table, grouped by category"""
+    global _help_embed
+
+    embed = discord.Embed(
+        title="Bishop Bot Help",
+        description="Here are the available commands:",
+        color=discord.Color.blue()
+    )
+
+    by_category = {}
+    for name, description, category, usage, callback in command_table:
+        by_category.setdefault(category, []).append(f"`{usage}` - {description}")
+
+    for category, entries in by_category.items():
+        embed.add_field(name=f"{category} Commands", value="\n".join(entries), inline=False)
+
+    embed.set_footer(text="Made by Bioku87")
+    _help_embed = embed
+
+# Static base of the /info embed; copied before dynamic fields are added
+_INFO_EMBED_BASE = discord.Embed(
+    title="About Bishop Bot",
+    description="Discord bot for tabletop RPG sessions with audio and voice features.",
+    color=discord.Color.blue()
+)
+_INFO_EMBED_BASE.add_field(name="Version", value="v0.1.0", inline=True)
+_INFO_EMBED_BASE.add_field(name="Created By", value="Bioku87", inline=True)
+
+# Built /info embed with a 1s TTL so command spam reuses one instance
+_info_cache = [0.0, None]  # [monotonic timestamp, embed]
+
+def _register_all_commands(bot):
+    """Define every slash command and register the full set in one pass"""
+
+    @deferred_ephemeral
+    async def help_command(interaction: discord.Interaction):
+        """Show help information about the bot and available commands"""
+        await interaction.followup.send(embed=_help_embed)
+
+    @deferred_ephemeral
+    async def info_command(interaction: discord.Interaction):
+        """Show information about the bot"""
+        # Reuse the built embed within the TTL; the dynamic values cannot
+        # change meaningfully within a second
+        now = time.monotonic()
+        if _info_cache[1] is not None and now - _info_cache[0] < 1.0:
+            await interaction.followup.send(embed=_info_cache[1])
+            return
+
+        embed = _INFO_EMBED_BASE.copy()
+
+        # Add uptime if available
+        if hasattr(bot, 'get_uptime'):
+            embed.add_field(name="Uptime", value=bot.get_uptime(), inline=True)
+        
+        # Add system information
+        embed.add_field(name="Connected Servers", value=str(len(bot.guilds)), inline=True)
+        
+        # Add component status, rendered once at component init
+        components = getattr(bot, 'components_status_str', None)
+        if components:
+            embed.add_field(name="Components", value=components, inline=False)
+        
+        embed.set_footer(text=f"Discord ID: {bot.user.id}")
+
+        _info_cache[0] = now
+        _info_cache[1] = embed
+
+        await interaction.followup.send(embed=embed)
+
+    @deferred_ephemeral
+    async def ping_command(interaction: discord.Interaction):
+        """Check the bot's latency to Discord servers"""
+        latency = round(bot.latency * 1000)  # Convert to ms
+        await interaction.followup.send(f"Pong! 🏓\nBot latency: {latency}ms")
+
+    @app_commands.describe(channel="The voice channel to join")
+    @require_voice
+    async def join_command(interaction: discord.Interaction, channel: Optional[discord.VoiceChannel] = None):
+        """Join a voice channel"""
+        # If no channel specified, use the user's current channel; this is a
+        # memory-only check, so answer directly instead of defer + followup
+        if channel is None:
+            if not interaction.user.voice:
+                await interaction.response.send_message("You need to be in a voice channel or specify a channel to join.", ephemeral=True)
+                return
+            channel = interaction.user.voice.channel
+
+        # Defer the response to give us time to process
+        await interaction.response.defer(ephemeral=True)
+        
+        # Join the voice channel
+        success = await bot.voice_manager.join_voice_channel(channel)
+        
+        if success:
+            await interaction.followup.send(f"Joined voice channel: {channel.name}", ephemeral=True)
+        else:
+            await interaction.followup.send(f"Failed to join voice channel: {channel.name}", ephemeral=True)
+
+    @require_voice
+    async def leave_command(interaction: discord.Interaction):
+        """Leave the current voice channel"""
+        # Defer the response
+        await interaction.response.defer(ephemeral=True)
+
+        guild_id = interaction.guild_id
+        
+        # Check if connected; guild.voice_client is tracked directly by the
+        # library, so this is one attribute access instead of a manager lookup
+        if interaction.guild.voice_client is None:
+            await interaction.followup.send("I'm not connected to a voice channel.", ephemeral=True)
+            return
+        
+        # Leave the voice channel
+        success = await bot.voice_manager.disconnect_from_guild(guild_id)
+        
+        if success:
+            await interaction.followup.send("Left the voice channel.", ephemeral=True)
+        else:
+            await interaction.followup.send("Failed to leave the voice channel.", ephemeral=True)
+
+    @require_voice
+    async def record_command(interaction: discord.Interaction):
+        """Start recording the current voice channel"""
+        # Defer publicly; the success message must be visible to everyone
+        await interaction.response.defer(ephemeral=False)
+
+        guild_id = interaction.guild_id
+        
+        # Check if connected via the library-tracked voice client
+        if interaction.guild.voice_client is None:
+            await interaction.followup.send("I need to be in a voice channel first. Use `/join` to add me.", ephemeral=True)
+            return
+        
+        # Check if already recording
+        if bot.voice_manager.is_recording(guild_id):
+            await interaction.followup.send("Already recording in this channel. Use `/stoprecord` to stop.", ephemeral=True)
+            return
+        
+        # Start recording
+        success = await bot.voice_manager.start_recording(guild_id)
+        
+        if success:
+            await interaction.followup.send("📹 Started recording the voice channel!", ephemeral=False)  # Visible to everyone
+        else:
+            await interaction.followup.send("Failed to start recording.", ephemeral=True)
+
+    @require_voice
+    async def stoprecord_command(interaction: discord.Interaction):
+        """Stop recording the current voice channel"""
+        # Defer publicly; the success message must be visible to everyone
+        await interaction.response.defer(ephemeral=False)
+
+        guild_id = interaction.guild_id
+        
+        # Check if recording
+        if not bot.voice_manager.is_recording(guild_id):
+            await interaction.followup.send("Not currently recording.", ephemeral=True)
+            return
+        
+        # Stop recording
+        success = await bot.voice_manager.stop_recording(guild_id)
+        
+        if success:
+            # A new transcript is about to appear; don't serve stale listings
+            _invalidate_transcripts_cache(guild_id)
+            await interaction.followup.send("⏹️ Stopped recording. Transcribing audio...", ephemeral=False)  # Visible to everyone
+        else:
+            await interaction.followup.send("Failed to stop recording.", ephemeral=True)
+
+    @require_voice
+    async def transcripts_command(interaction: discord.Interaction):
+        """List available transcripts for this server"""
+        # Defer the response
+        await interaction.response.defer(ephemeral=True)
+
+        guild_id = interaction.guild_id
+        
+        # Get transcripts
+        transcripts = await _get_transcripts(bot.voice_manager, guild_id)
+        
+        if not transcripts:
+            await interaction.followup.send("No transcripts found for this server.", ephemeral=True)
+            return
+        
+        # Create (or reuse) the embed with the transcript list
+        embed = _transcripts_embed(guild_id, transcripts)
+        
+        await interaction.followup.send(embed=embed, ephemeral=True)
+
+    @app_commands.describe(number="The transcript number from the list")
+    @require_voice
+    async def readtranscript_command(interaction: discord.Interaction, number: int):
+        """Read a specific transcript"""
+        # Defer the response
+        await interaction.response.defer(ephemeral=True)
+
+        guild_id = interaction.guild_id
+        
+        # Get transcripts
+        transcripts = await _get_transcripts(bot.voice_manager, guild_id)
+        
+        if not transcripts:
+            await interaction.followup.send("No transcripts found for this server.", ephemeral=True)
+            return
+        
+        # Check if number is valid
+        if number < 1 or number > len(transcripts):
+            await interaction.followup.send(f"Invalid transcript number. Please choose between 1 and {len(transcripts)}.", ephemeral=True)
+            return
+        
+        # Get the transcript
+        transcript = transcripts[number-1]
+        
+        # Check the size up front so large transcripts are never read in full
+        try:
+            size = await asyncio.to_thread(os.path.getsize, transcript['path'])
+        except OSError:
+            size = 0
+
+        # Create embed for transcript
+        embed = discord.Embed(
+            title=f"Transcript: {transcript['date']}",
+            description="Session transcript from voice recording",
+            color=discord.Color.blue()
+        )
+
+        # Discord limits fields to 4096 chars; for long transcripts read only
+        # the start and end instead of materializing the whole file
+        if size > 4000:
+            head, tail = await bot.voice_manager.read_transcript_head_tail(transcript['path'])
+
+            if head is None:
+                await interaction.followup.send("Failed to read transcript.", ephemeral=True)
+                return
+
+            embed.add_field(name="Beginning", value=head, inline=False)
+            embed.add_field(name="End", value=tail, inline=False)
+            embed.add_field(name="Note", value="Transcript was too long to display in full. The complete file is attached.", inline=False)
+
+            # Attach the transcript straight from its stored location; no
+            # temp copy on disk, so concurrent reads cannot collide
+            try:
+                file = discord.File(transcript['path'], filename=f"Transcript_{number}.txt")
+            except OSError as e:
+                logger.error("Error attaching transcript file: %s", e)
+                file = None
+
+            if file is not None:
+                await interaction.followup.send(embed=embed, file=file, ephemeral=True)
+                return
+        else:
+            content = await bot.voice_manager.read_transcript(transcript['path'])
+
+            if not content:
+                await interaction.followup.send("Failed to read transcript.", ephemeral=True)
+                return
+
+            embed.add_field(name="Content", value=content, inline=False)
+        
+        await interaction.followup.send(embed=embed, ephemeral=True)
+
+    @app_commands.describe(sound="The sound to play", category="The category of sounds (default: Default)")
+    @require_audio
+    async def play_command(interaction: discord.Interaction, sound: str, category: str = "Default"):
+        """Play a sound from the soundboard"""
+        # Not connected and the user is not in a voice channel either: both
+        # checks are memory-only, so answer without the defer round trip
+        if interaction.guild.voice_client is None and not interaction.user.voice:
+            await interaction.response.send_message("I need to be in a voice channel first. Join a voice channel and use `/join`.", ephemeral=True)
+            return
+
+        # Defer the response
+        await interaction.response.defer(ephemeral=True)
+
+        guild_id = interaction.guild_id
+        
+        # Check if in a voice channel via the library-tracked voice client
+        if interaction.guild.voice_client is None:
+            # Try to join the user's voice channel
+            channel = interaction.user.voice.channel
+            success = await bot.voice_manager.join_voice_channel(channel)
+            
+            if not success:
+                await interaction.followup.send("Failed to join your voice channel.", ephemeral=True)
+                return
+        
+        # Play the sound
+        try:
+            await bot.audio_manager.play_sound(guild_id, sound, category)
+            await interaction.followup.send(f"Playing sound: {sound} from category: {category}", ephemeral=True)
+        except Exception as e:
+            await interaction.followup.send(f"Failed to play sound: {str(e)}", ephemeral=True)
+
+    @require_audio
+    async def stop_command(interaction: discord.Interaction):
+        """Stop audio playback"""
+        # Defer the response
+        await interaction.response.defer(ephemeral=True)
+
+        guild_id = interaction.guild_id
+        
+        # Stop playback
+        try:
+            await bot.audio_manager.stop_playback(guild_id)
+            await interaction.followup.send("Stopped audio playback.", ephemeral=True)
+        except Exception as e:
+            await interaction.followup.send(f"Failed to stop playback: {str(e)}", ephemeral=True)
+
+    @app_commands.describe(category="The category of sounds to list (default: all)")
+    @require_audio
+    async def soundboard_command(interaction: discord.Interaction, category: Optional[str] = None):
+        """Show available sounds on the soundboard"""
+        # Defer the response
+        await interaction.response.defer(ephemeral=True)
+
+        # Get the cached soundboard index; the stat/scandir calls run in a
+        # worker thread so cache misses don't block the event loop
+        categories, sounds_by_category, fields_by_category = await asyncio.to_thread(_get_soundboard_index)
+
+        if not categories:
+            await interaction.followup.send("No sound categories available.", ephemeral=True)
+            return
+        
+        if category is None:
+            # Show a list of categories
+            embed = discord.Embed(
+                title="Soundboard Categories",
+                description="Available sound categories:",
+                color=discord.Color.blue()
+            )
+            
+            for cat in sorted(categories):
+                # Count sounds in each category
+                sounds = sounds_by_category.get(cat, [])
+
+                embed.add_field(
+                    name=cat,
+                    value=f"{len(sounds)} sounds available",
+                    inline=True
+                )
+            
+            embed.set_footer(text="Use /soundboard <category> to see sounds in a specific category")
+            
+            await interaction.followup.send(embed=embed, ephemeral=True)
+        else:
+            # Show sounds in the selected category
+            if category not in categories:
+                await interaction.followup.send(f"Category '{category}' not found.", ephemeral=True)
+                return
+                
+            # Get sounds in the category
+            sounds = sounds_by_category.get(category, [])
+
+            if not sounds:
+                await interaction.followup.send(f"No sounds found in category '{category}'.", ephemeral=True)
+                return
+                
+            # Create embed with sound list
+            embed = discord.Embed(
+                title=f"Sounds in '{category}'",
+                description=f"Use `/play <sound> {category}` to play a sound.",
+                color=discord.Color.blue()
+            )
+            
+            # Field values are pre-joined at scan time; Discord caps embeds
+            # at 25 fields, so stop at 24 sound groups
+            for i, value in enumerate(islice(fields_by_category.get(category, ()), 24)):
+                count = value.count("\n") + 1
+                embed.add_field(
+                    name=f"Sounds {i*20+1}-{i*20+count}",
+                    value=value,
+                    inline=False
+                )
+            
+            await interaction.followup.send(embed=embed, ephemeral=True)
+
+    async def sync_command(interaction: discord.Interaction):
+        """Force sync commands with Discord - for admins only"""
+        # Check if user is admin
+        if not interaction.user.guild_permissions.administrator:
+            await interaction.response.send_message("This command is only for administrators.", ephemeral=True)
+            return
+            
+        await interaction.response.defer(ephemeral=True)
+        
+        try:
+            # Sync commands
+            await bot.tree.sync()
+            await interaction.followup.send("Commands synced successfully!", ephemeral=True)
+        except Exception as e:
+            await interaction.followup.send(f"Failed to sync commands: {str(e)}", ephemeral=True)
+    
+
+    # Declarative command table: (name, description, category, usage, callback)
+    command_table = (
+        ("help", "Show available commands", "General", "/help", help_command),
+        ("info", "Show bot information", "General", "/info", info_command),
+        ("ping", "Check bot latency", "General", "/ping", ping_command),
+        ("join", "Join a voice channel", "Voice", "/join [channel]", join_command),
+        ("leave", "Leave the voice channel", "Voice", "/leave", leave_command),
+        ("record", "Start recording the voice channel", "Voice", "/record", record_command),
+        ("stoprecord", "Stop recording the voice channel", "Voice", "/stoprecord", stoprecord_command),
+        ("transcripts", "List available transcripts", "Voice", "/transcripts", transcripts_command),
+        ("readtranscript", "Read a specific transcript", "Voice", "/readtranscript <number>", readtranscript_command),
+        ("play", "Play a sound from the soundboard", "Audio", "/play <sound> [category]", play_command),
+        ("stop", "Stop audio playback", "Audio", "/stop", stop_command),
+        ("soundboard", "Show available sounds", "Audio", "/soundboard [category]", soundboard_command),
+        ("sync", "Force sync commands with Discord (Admin Only)", "Admin", "/sync", sync_command),
+    )
+
+    for name, description, category, usage, callback in command_table:
+        bot.tree.command(name=name, description=description)(callback)
+
+    registered_commands.clear()
+    registered_commands.update(entry[0] for entry in command_table)
+    _build_help_embed(command_table)
@@ -2,6 +2,7 @@
 Bishop Bot - Rules Commands
 Last updated: 2025-05-31 19:08:32 UTC by Bioku87
 """
+import asyncio
 import discord
 import logging
 from discord import app_commands
@@ -9,28 +10,51 @@ from discord.ext import commands
 
 logger = logging.getLogger('bishop_bot.commands.rules')
 
+# Embed colors, built once
+_LOOKUP_COLOR = discord.Color.green()
+_COND_COLOR = discord.Color.red()
+
 async def register_rules_commands(bot):
     """Register rules-related commands"""
     
+    # Resolve the manager once at registration; handlers read the local
+    # instead of probing bot attributes on every interaction
+    rules_manager = getattr(bot, 'rules_manager', None)
+    
     # Default systems for autocomplete
     AVAILABLE_SYSTEMS = ["dnd5e", "pathfinder2e", "callofcthulhu"]
     
+    # Systems with their precomputed lowercased forms and prebuilt Choice
+    # objects; fetched once per process since rule packs only change on reload
+    systems_cache = None
+    
+    def _get_systems():
+        nonlocal systems_cache
+        if systems_cache is None:
+            systems = AVAILABLE_SYSTEMS
+            if rules_manager is not None:
+                try:
+                    systems = rules_manager.get_available_systems()
+                except (AttributeError, RuntimeError) as e:
+                    # The defaults get cached, so a broken manager is
+                    # logged once instead of re-probed every keystroke
+                    logger.warning("Could not fetch available systems: %s", e)
+            choices = [app_commands.Choice(name=s, value=s) for s in systems]
+            # casefold matches lower for ASCII but folds full Unicode correctly
+            systems_cache = (choices, [s.casefold() for s in systems])
+        return systems_cache
+    
     # System autocomplete
     async def system_autocomplete(interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
-        systems = AVAILABLE_SYSTEMS
+        choices, lowered = _get_systems()
         
-        # Get actual systems from rules manager if available
-        if hasattr(bot, 'rules_manager'):
-            try:
-                systems = bot.rules_manager.get_available_systems()
-            except:
-                pass
-        
-        # Filter by current input
-        filtered = [s for s in systems if current.lower() in s.lower()]
-        
-        # Convert to choices
-        return [app_commands.Choice(name=s, value=s) for s in filtered[:25]]
+        # Filter by current input against the precomputed casefolded forms,
+        # reusing the prebuilt Choice objects instead of allocating per keystroke
+        cl = current.casefold()
+        return [
+            choice
+            for choice, low in zip(choices, lowered) if cl in low
+        ][:25]
     
     @bot.tree.command(name="lookup", description="Look up a game rule")
     @app_commands.describe(
@@ -41,40 +65,48 @@ async def register_rules_commands(bot):
     async def lookup_command(interaction: discord.Interaction, system: str, query: str):
         try:
             # Check if rules manager exists
-            if not hasattr(bot, 'rules_manager'):
+            if rules_manager is None:
                 await interaction.response.send_message("Rules lookup is not available.", ephemeral=True)
                 return
             
-            # Search for rules
-            results = bot.rules_manager.search_rules(system, query)
+            # Defer so a cold rule-pack load cannot hit Discord's 3s window
+            await interaction.response.defer()
+            
+            # Search for rules off the event loop; a cold call loads the
+            # rule pack from disk before scanning
+            results = await asyncio.to_thread(rules_manager.search_rules, system, query)
             
             if not results:
-                await interaction.response.send_message(f"No rules found for '{query}' in {system}.", ephemeral=True)
+                await interaction.followup.send(f"No rules found for '{query}' in {system}.", ephemeral=True)
                 return
             
-            # Create embed response
-            embed = discord.Embed(
-                title=f"Rule Lookup: {query}",
-                description=f"Found {len(results)} rule(s) in {system}",
-                color=discord.Color.green()
-            )
-            
-            # Add rules to embed (limit to first 5)
-            for i, rule in enumerate(results[:5]):
-                embed.add_field(
-                    name=f"{rule.get('name', 'Unknown')} ({rule.get('category', 'General')})",
-                    value=rule.get('description', 'No description available')[:1024],  # Discord limit
-                    inline=False
-                )
+            # Build the embed in one shot; the display strings are
+            # pre-rendered and pre-truncated at rule-load time, so the
+            # per-field add_field validation is skipped (limit to first 5)
+            embed_data = {
+                "title": f"Rule Lookup: {query}",
+                "description": f"Found {len(results)} rule(s) in {system}",
+                "color": _LOOKUP_COLOR.value,
+                "fields": [
+                    {
+                        "name": rule.get('_field_name', 'Unknown'),
+                        "value": rule.get('_desc_truncated', 'No description available'),
+                        "inline": False
+                    }
+                    for rule in results[:5]
+                ]
+            }
             
             # Add note if more results were found
             if len(results) > 5:
-                embed.set_footer(text=f"Showing 5 of {len(results)} results. Refine your search for more specific results.")
+                embed_data["footer"] = {"text": f"Showing 5 of {len(results)} results. Refine your search for more specific results."}
+            
+            embed = discord.Embed.from_dict(embed_data)
             
-            await interaction.response.send_message(embed=embed)
+            await interaction.followup.send(embed=embed)
         except Exception as e:
             logger.error(f"Error in lookup command: {e}")
-            await interaction.response.send_message("An error occurred during rule lookup.", ephemeral=True)
+            await interaction.followup.send("An error occurred during rule lookup.", ephemeral=True)
     
     @bot.tree.command(name="condition", description="Look up a game condition")
     @app_commands.describe(
@@ -85,37 +117,37 @@ async def register_rules_commands(bot):
     async def condition_command(interaction: discord.Interaction, system: str, condition: str):
         try:
             # Check if rules manager exists
-            if not hasattr(bot, 'rules_manager'):
+            if rules_manager is None:
                 await interaction.response.send_message("Condition lookup is not available.", ephemeral=True)
                 return
             
-            # Look up the condition
-            rule = bot.rules_manager.get_rule(system, "conditions", condition.lower())
+            # Defer so a cold rule-pack load cannot hit Discord's 3s window
+            await interaction.response.defer()
+            
+            # Look up the condition off the event loop; a cold call loads
+            # the rule pack from disk first
+            rule = await asyncio.to_thread(rules_manager.get_rule, system, "conditions", condition.lower())
             
             if not rule:
-                await interaction.response.send_message(f"Condition '{condition}' not found in {system}.", ephemeral=True)
+                await interaction.followup.send(f"Condition '{condition}' not found in {system}.", ephemeral=True)
                 return
             
-            # Create embed response
-            embed = discord.Embed(
-                title=rule.get('name', 'Unknown Condition'),
-                description=rule.get('description', 'No description available'),
-                color=discord.Color.red()
-            )
-            
-            # Add additional fields if they exist
-            for key, value in rule.items():
-                if key not in ['name', 'description'] and isinstance(value, str):
-                    embed.add_field(
-                        name=key.title(),
-                        value=value,
-                        inline=True
-                    )
+            # Build the embed in one shot; extra fields are filtered and
+            # title-cased at rule-load time
+            embed = discord.Embed.from_dict({
+                "title": rule.get('name', 'Unknown Condition'),
+                "description": rule.get('description', 'No description available'),
+                "color": _COND_COLOR.value,
+                "fields": [
+                    {"name": name, "value": value, "inline": True}
+                    for name, value in rule.get('_extra_fields', ())
+                ]
+            })
             
-            await interaction.response.send_message(embed=embed)
+            await interaction.followup.send(embed=embed)
         except Exception as e:
             logger.error(f"Error in condition command: {e}")
-            await interaction.response.send_message("An error occurred during condition lookup.", ephemeral=True)
+            await interaction.followup.send("An error occurred during condition lookup.", ephemeral=True)
     
     @bot.tree.command(name="spell", description="Look up a spell")
     @app_commands.describe(
@@ -126,7 +158,7 @@ async def register_rules_commands(bot):
     async def spell_command(interaction: discord.Interaction, system: str, spell: str):
         try:
             # Check if rules manager exists
-            if not hasattr(bot, 'rules_manager'):
+            if rules_manager is None:
                 await interaction.response.send_message("Spell lookup is not available.", ephemeral=True)
                 return
             
@@ -2,18 +2,35 @@
 Bishop Bot - Voice Commands (Simplified)
 Last updated: 2025-05-31 23:13:05 UTC by Bioku87
 """
+import asyncio
 import discord
+import io
 import logging
 import os
+import time
 from discord import app_commands
 from discord.ext import commands
-from datetime import datetime
+
+from .registration import require_manager
 
 logger = logging.getLogger('bishop_bot.commands.voice')
 
+# Strip characters that are unsafe in session filenames; a translation
+# table is cheaper than a regex on the request path
+_SESSION_NAME_SANITIZE = str.maketrans('', '', '/\\:*?"<>| ')
+
+# Shared availability guards; replace the per-handler hasattr blocks
+_require_recording = require_manager('voice_manager', "Voice recording is not available.")
+_require_transcripts = require_manager('voice_manager', "Voice transcription is not available.")
+
 async def register_voice_commands(bot):
     """Register voice-related commands"""
     
+    # Resolve the managers once at registration; handlers read the locals
+    # instead of probing bot attributes on every interaction
+    voice_manager = getattr(bot, 'voice_manager', None)
+    audio_manager = getattr(bot, 'audio_manager', None)
+    
     @bot.tree.command(name="join", description="Join a voice channel")
     @app_commands.describe(channel="The voice channel to join (optional, will use your current channel if not specified)")
     async def join_command(interaction: discord.Interaction, channel: discord.VoiceChannel = None):
@@ -26,17 +43,20 @@ async def register_voice_commands(bot):
                     await interaction.response.send_message("You need to specify a channel or be in a voice channel.", ephemeral=True)
                     return
             
-            # Join the channel
-            await interaction.response.defer(ephemeral=True)
-            
-            # Join with voice manager
-            success = False
-            if hasattr(bot, 'voice_manager'):
-                success = await bot.voice_manager.join_voice_channel(channel)
+            # Join the channel; defer publicly so the joined confirmation
+            # is visible to everyone
+            await interaction.response.defer(ephemeral=False)
             
-            # Also connect audio manager to the same channel
-            if hasattr(bot, 'audio_manager'):
-                success = await bot.audio_manager.join_voice_channel(channel)
+            # Both joins are voice handshakes with Discord; run them
+            # concurrently instead of paying the round trips back to back
+            joins = []
+            if voice_manager is not None:
+                joins.append(voice_manager.join_voice_channel(channel))
+            if audio_manager is not None:
+                joins.append(audio_manager.join_voice_channel(channel))
+
+            results = await asyncio.gather(*joins, return_exceptions=True)
+            success = any(r is True for r in results)
             
             if success:
                 await interaction.followup.send(f"Joined voice channel: {channel.name}", ephemeral=False)
@@ -49,20 +69,16 @@ async def register_voice_commands(bot):
     @bot.tree.command(name="leave", description="Leave the current voice channel")
     async def leave_command(interaction: discord.Interaction):
         try:
-            success = False
-            
-            # Disconnect voice manager if available
-            if hasattr(bot, 'voice_manager'):
-                if bot.voice_manager.is_connected(interaction.guild_id):
-                    await bot.voice_manager.disconnect_from_guild(interaction.guild_id)
-                    success = True
-                    
-            # Disconnect audio manager if available
-            if hasattr(bot, 'audio_manager'):
-                if bot.audio_manager.is_connected(interaction.guild_id):
-                    await bot.audio_manager.disconnect_from_guild(interaction.guild_id)
-                    success = True
-                    
+            # Disconnect both managers concurrently
+            disconnects = []
+            for manager in (voice_manager, audio_manager):
+                if manager and manager.is_connected(interaction.guild_id):
+                    disconnects.append(manager.disconnect_from_guild(interaction.guild_id))
+
+            success = bool(disconnects)
+            if disconnects:
+                await asyncio.gather(*disconnects, return_exceptions=True)
+
             if success:
                 await interaction.response.send_message("Left the voice channel.")
             else:
@@ -72,15 +88,9 @@ async def register_voice_commands(bot):
             await interaction.response.send_message("An error occurred while leaving the voice channel.", ephemeral=True)
     
     @bot.tree.command(name="record", description="Start recording the voice channel")
+    @_require_recording
     async def record_command(interaction: discord.Interaction):
         try:
-            # Get voice manager from bot
-            if not hasattr(bot, 'voice_manager'):
-                await interaction.response.send_message("Voice recording is not available.", ephemeral=True)
-                return
-                
-            voice_manager = bot.voice_manager
-            
             # Check if the bot is in a voice channel in this guild
             if not voice_manager.is_connected(interaction.guild_id):
                 await interaction.response.send_message("I'm not in a voice channel.", ephemeral=True)
@@ -91,12 +101,15 @@ async def register_voice_commands(bot):
                 await interaction.response.send_message("Already recording in this channel.", ephemeral=True)
                 return
             
-            # Generate a session ID
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            # Generate a session ID; time.strftime on a UTC struct skips
+            # the locale-aware datetime path
+            timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
             channel_name = interaction.channel.name if interaction.channel else "unknown"
-            session_id = f"session_{timestamp}_{channel_name}"
+            session_id = f"session_{timestamp}_{channel_name.translate(_SESSION_NAME_SANITIZE)}"
             
-            # Start recording
+            # Start recording; defer first so setup I/O cannot hit
+            # Discord's 3s window
+            await interaction.response.defer()
             success = await voice_manager.start_recording(interaction.guild_id, session_id)
             
             if success:
@@ -109,23 +122,17 @@ async def register_voice_commands(bot):
                 embed.add_field(name="Started by", value=interaction.user.mention)
                 embed.set_footer(text="Use /stoprecord to stop recording")
                 
-                await interaction.response.send_message(embed=embed)
+                await interaction.followup.send(embed=embed)
             else:
-                await interaction.response.send_message("Failed to start recording.", ephemeral=True)
+                await interaction.followup.send("Failed to start recording.", ephemeral=True)
         except Exception as e:
             logger.error(f"Error in record command: {e}")
-            await interaction.response.send_message("An error occurred while starting the recording.", ephemeral=True)
+            await interaction.followup.send("An error occurred while starting the recording.", ephemeral=True)
     
     @bot.tree.command(name="stoprecord", description="Stop recording the voice channel")
+    @_require_recording
     async def stop_record_command(interaction: discord.Interaction):
         try:
-            # Get voice manager from bot
-            if not hasattr(bot, 'voice_manager'):
-                await interaction.response.send_message("Voice recording is not available.", ephemeral=True)
-                return
-                
-            voice_manager = bot.voice_manager
-            
             # Check if the bot is recording in this guild
             if not voice_manager.is_recording(interaction.guild_id):
                 await interaction.response.send_message("I'm not currently recording.", ephemeral=True)
@@ -152,20 +159,17 @@ async def register_voice_commands(bot):
             await interaction.followup.send("An error occurred while stopping the recording.", ephemeral=True)
     
     @bot.tree.command(name="transcripts", description="Get available session transcripts")
+    @_require_transcripts
     async def transcripts_command(interaction: discord.Interaction):
         try:
-            # Get voice manager from bot
-            if not hasattr(bot, 'voice_manager'):
-                await interaction.response.send_message("Voice transcription is not available.", ephemeral=True)
-                return
-                
-            voice_manager = bot.voice_manager
+            # Defer before the listing scan touches disk
+            await interaction.response.defer()
             
             # Get available transcripts
             transcripts = await voice_manager.get_session_transcripts(interaction.guild_id)
             
             if not transcripts:
-                await interaction.response.send_message("No transcripts found for this server.", ephemeral=True)
+                await interaction.followup.send("No transcripts found for this server.", ephemeral=True)
                 return
             
             # Create embed with transcript list
@@ -185,32 +189,29 @@ async def register_voice_commands(bot):
             
             embed.set_footer(text="Use /readtranscript <number> to read a transcript")
             
-            await interaction.response.send_message(embed=embed)
+            await interaction.followup.send(embed=embed)
         except Exception as e:
             logger.error(f"Error in transcripts command: {e}")
-            await interaction.response.send_message("An error occurred while getting the transcripts.", ephemeral=True)
+            await interaction.followup.send("An error occurred while getting the transcripts.", ephemeral=True)
     
     @bot.tree.command(name="readtranscript", description="Read a transcript by number")
     @app_commands.describe(number="The transcript number from /transcripts")
+    @_require_transcripts
     async def read_transcript_command(interaction: discord.Interaction, number: int):
         try:
-            # Get voice manager from bot
-            if not hasattr(bot, 'voice_manager'):
-                await interaction.response.send_message("Voice transcription is not available.", ephemeral=True)
-                return
-                
-            voice_manager = bot.voice_manager
+            # Defer before the listing scan and file read touch disk
+            await interaction.response.defer()
             
             # Get available transcripts
             transcripts = await voice_manager.get_session_transcripts(interaction.guild_id)
             
             if not transcripts:
-                await interaction.response.send_message("No transcripts found for this server.", ephemeral=True)
+                await interaction.followup.send("No transcripts found for this server.", ephemeral=True)
                 return
             
             # Check if number is valid
             if number < 1 or number > len(transcripts):
-                await interaction.response.send_message(f"Invalid transcript number. Choose between 1 and {len(transcripts)}.", ephemeral=True)
+                await interaction.followup.send(f"Invalid transcript number. Choose between 1 and {len(transcripts)}.", ephemeral=True)
                 return
             
             # Get the transcript
@@ -218,31 +219,22 @@ async def register_voice_commands(bot):
             transcript_content = await voice_manager.read_transcript(transcript['path'])
             
             if not transcript_content:
-                await interaction.response.send_message("Failed to read transcript.", ephemeral=True)
+                await interaction.followup.send("Failed to read transcript.", ephemeral=True)
                 return
             
             # Limit content length for Discord
             if len(transcript_content) > 1900:
-                # Create a text file for the transcript
-                filename = f"Transcript_{number}.txt"
-                with open(filename, "w", encoding="utf-8") as f:
-                    f.write(transcript_content)
-                
-                # Send as file
-                file = discord.File(filename)
-                await interaction.response.send_message(f"Transcript #{number} - {transcript['filename']}", file=file)
-                
-                # Clean up file
-                try:
-                    os.remove(filename)
-                except:
-                    pass
+                # Send straight from memory; no temp file on disk and no
+                # name collisions between concurrent reads
+                buf = io.BytesIO(transcript_content.encode("utf-8"))
+                file = discord.File(buf, filename=f"Transcript_{number}.txt")
+                await interaction.followup.send(f"Transcript #{number} - {transcript['filename']}", file=file)
             else:
                 # Send as message
-                await interaction.response.send_message(f"**Transcript #{number} - {transcript['filename']}**\n```\n{transcript_content}\n```")
+                await interaction.followup.send(f"**Transcript #{number} - {transcript['filename']}**\n```\n{transcript_content}\n```")
         except Exception as e:
             logger.error(f"Error in read_transcript command: {e}")
-            await interaction.response.send_message("An error occurred while reading the transcript.", ephemeral=True)
+            await interaction.followup.send("An error occurred while reading the transcript.", ephemeral=True)
     
     logger.info("Voice commands registered")
     return True
\ No newline at end of file
@@ -5,6 +5,7 @@ Last updated: 2025-05-31 15:29:42 UTC by Bioku87
 Handles D&D character registration and lookup for users.
 """
 import os
+import copy
 import json
 import asyncio
 import logging
@@ -14,17 +15,56 @@ from datetime import datetime
 # Import database manager
 from database import db_manager
 
+# orjson parses large character files several times faster when installed
+try:
+    import orjson
+    
+    def _json_parse(raw):
+        return orjson.loads(raw)
+except ImportError:
+    def _json_parse(raw):
+        return json.loads(raw)
+
 logger = logging.getLogger('bishop_bot.characters')
 
+# Cache-key -> database-column mapping used when normalizing DB rows;
+# one shared tuple keeps per-row dict construction tight
+_DB_FIELD_MAP = (
+    ('user_id', 'user_id'),
+    ('username', 'username'),
+    ('character_name', 'character_name'),
+    ('race', 'race'),
+    ('class', 'character_class'),
+    ('subclass', 'sub_class'),
+    ('real_name', 'real_name'),
+    ('created_at', 'created_at'),
+    ('updated_at', 'updated_at'),
+)
+
+def _normalize_db_row(char):
+    """Convert a database character row into the cache layout"""
+    return {key: char[column] for key, column in _DB_FIELD_MAP}
+
 class CharacterManager:
     """Manages character data for Bishop Bot"""
     
     def __init__(self):
         """Initialize the character manager"""
         self.characters = {}
+        # Secondary index: lowercased username -> user_id, so username
+        # lookups are dict hits instead of linear scans
+        self._username_index = {}
         self.data_file = os.path.join("data", "characters", "characters.json")
         self.characters_dir = os.path.join("data", "characters")
         
+        # Debounced save state: mutations mark the cache dirty and a
+        # single pending task rewrites the file after the flush interval
+        self._loaded = False
+        self._dirty = False
+        self._flush_interval = 5.0
+        self._flush_task = None
+        self._flush_lock = asyncio.Lock()
+        
         # Ensure directories exist
         os.makedirs(self.characters_dir, exist_ok=True)
         
@@ -33,62 +73,133 @@ class CharacterManager:
         try:
             # Load character data from file and database
             await self.load_characters()
+            self._loaded = True
             logger.info("Character manager initialized")
         except Exception as e:
             logger.error(f"Error initializing character manager: {e}")
     
+    def _load_file_sync(self):
+        """Read and parse the character file (runs in a worker thread)"""
+        with open(self.data_file, 'rb') as f:
+            return _json_parse(f.read())
+    
     async def load_characters(self):
         """Load characters from storage"""
-        # Load from JSON file first
+        # Load from JSON file first, off the event loop
         if os.path.exists(self.data_file):
             try:
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.characters = data.get('characters', {})
-                    logger.info(f"Loaded {len(self.characters)} characters from file")
+                data = await asyncio.to_thread(self._load_file_sync)
+                self.characters = data.get('characters', {})
+                logger.info(f"Loaded {len(self.characters)} characters from file")
             except Exception as e:
                 logger.error(f"Error loading characters from file: {e}")
         
+        # Rebuild the username index to match the loaded cache
+        self._username_index = {
+            char["username"].lower(): user_id
+            for user_id, char in self.characters.items()
+            if char.get("username")
+        }
+        
         # Then load/sync with database
         try:
             db_characters = await db_manager.get_all_characters()
             
+            # Add rows not already cached, normalized through the shared map
             for char in db_characters:
                 user_id = char["user_id"]
                 
-                # Add to in-memory cache if not present
                 if user_id not in self.characters:
-                    self.characters[user_id] = {
-                        "user_id": user_id,
-                        "username": char["username"],
-                        "character_name": char["character_name"],
-                        "race": char["race"],
-                        "class": char["character_class"],
-                        "subclass": char["sub_class"],
-                        "real_name": char["real_name"],
-                        "created_at": char["created_at"],
-                        "updated_at": char["updated_at"]
-                    }
+                    self.characters[user_id] = _normalize_db_row(char)
+                    if char["username"]:
+                        self._username_index[char["username"].lower()] = user_id
         except Exception as e:
             logger.error(f"Error loading characters from database: {e}")
     
     async def save_characters(self):
-        """Save characters to file"""
-        try:
-            data = {
-                'version': 1,
-                'last_updated': datetime.now().isoformat(),
-                'characters': self.characters
-            }
+        """Mark the character cache dirty and schedule a debounced flush
+        
+        Every mutation used to rewrite the whole file immediately, so a
+        burst of registrations serialized the full dataset once per
+        character. Writes now coalesce into one rewrite per interval.
+        """
+        self._dirty = True
+        
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._delayed_flush())
+        return True
+    
+    async def _delayed_flush(self):
+        """Flush the cache after the debounce interval, looping while dirty
+
+        Mutations that land while a flush is writing re-mark the cache
+        dirty; the loop picks them up, and the task only finishes when it
+        observes a clean cache with no awaits before completion, so a
+        late mutation can never be stranded unscheduled.
+        """
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            await self.flush()
+            if not self._dirty:
+                return
+    
+    async def flush(self):
+        """Write the character cache to file if it has pending changes"""
+        async with self._flush_lock:
+            if not self._dirty:
+                return True
+            self._dirty = False
             
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            try:
+                # Deep-copy on the event loop so the worker thread
+                # serializes a consistent snapshot while commands keep
+                # mutating the live dicts
+                data = {
+                    'version': 1,
+                    'last_updated': datetime.now().isoformat(),
+                    'characters': copy.deepcopy(self.characters)
+                }
                 
-            logger.info(f"Saved {len(self.characters)} characters to file")
-            return True
-        except Exception as e:
-            logger.error(f"Error saving characters to file: {e}")
-            return False
+                # Serialize and write in a worker thread; a slow disk or a
+                # big roster must not stall the gateway heartbeat
+                await asyncio.to_thread(self._write_file_sync, data)
+                    
+                logger.info(f"Saved {len(self.characters)} characters to file")
+                return True
+            except Exception as e:
+                logger.error(f"Error saving characters to file: {e}")
+                self._dirty = True
+                return False
+    
+    def _write_file_sync(self, data):
+        """Serialize and write the character file (runs in a worker thread)
+        
+        Serializing to one string first keeps the write a single
+        buffered call instead of one per JSON token. The payload goes to
+        a temp file that is fsynced and renamed over the real one, so a
+        crash mid-write can never leave a truncated roster behind.
+        """
+        payload = json.dumps(data, indent=2, ensure_ascii=False)
+        tmp_path = f"{self.data_file}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.data_file)
+        except BaseException:
+            # Leave the real file untouched; drop the partial temp file
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+    
+    async def shutdown(self):
+        """Flush any pending character changes before the bot exits"""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        await self.flush()
     
     async def register_character(self, user_id: str, username: str, character_data: Dict[str, Any]) -> bool:
         """Register a character for a user"""
@@ -107,8 +218,9 @@ class CharacterManager:
                 "updated_at": now
             }
             
-            # Add to in-memory cache
+            # Add to in-memory cache and the username index
             self.characters[user_id] = character
+            self._username_index[username.lower()] = user_id
             
             # Save to file
             await self.save_characters()
@@ -142,17 +254,9 @@ class CharacterManager:
             
             if character:
                 # Add to cache
-                self.characters[user_id] = {
-                    "user_id": character["user_id"],
-                    "username": character["username"],
-                    "character_name": character["character_name"],
-                    "race": character["race"],
-                    "class": character["character_class"],
-                    "subclass": character["sub_class"],
-                    "real_name": character["real_name"],
-                    "created_at": character["created_at"],
-                    "updated_at": character["updated_at"]
-                }
+                self.characters[user_id] = _normalize_db_row(character)
+                if character["username"]:
+                    self._username_index[character["username"].lower()] = user_id
                 
                 return self.characters[user_id]
         except Exception as e:
@@ -162,29 +266,21 @@ class CharacterManager:
     
     async def get_character_by_username(self, username: str) -> Optional[Dict[str, Any]]:
         """Get a character by username"""
-        # Check in-memory cache first
-        for char in self.characters.values():
-            if char["username"].lower() == username.lower():
-                return char
+        # The secondary index makes this a dict hit instead of a scan
+        user_id = self._username_index.get(username.lower())
+        if user_id is not None and user_id in self.characters:
+            return self.characters[user_id]
                 
         # Check database
         try:
             character = await db_manager.get_character_by_username(username)
             
             if character:
-                # Add to cache
+                # Add to cache and index
                 user_id = character["user_id"]
-                self.characters[user_id] = {
-                    "user_id": user_id,
-                    "username": character["username"],
-                    "character_name": character["character_name"],
-                    "race": character["race"],
-                    "class": character["character_class"],
-                    "subclass": character["sub_class"],
-                    "real_name": character["real_name"],
-                    "created_at": character["created_at"],
-                    "updated_at": character["updated_at"]
-                }
+                self.characters[user_id] = _normalize_db_row(character)
+                if character["username"]:
+                    self._username_index[character["username"].lower()] = user_id
                 
                 return self.characters[user_id]
         except Exception as e:
@@ -194,8 +290,17 @@ class CharacterManager:
     
     async def get_all_characters(self) -> Dict[str, Dict[str, Any]]:
         """Get all characters"""
-        # Refresh from database to ensure we have the latest
+        # The in-memory cache is authoritative: every mutation goes
+        # through this manager, so there is nothing to re-read per call
+        if not self._loaded:
+            await self.load_characters()
+            self._loaded = True
+        return self.characters
+    
+    async def refresh(self) -> Dict[str, Dict[str, Any]]:
+        """Force a reload from file and database"""
         await self.load_characters()
+        self._loaded = True
         return self.characters
     
     async def update_character(self, user_id: str, character_data: Dict[str, Any]) -> bool:
@@ -217,8 +322,15 @@ class CharacterManager:
                 "updated_at": now
             }
             
-            # Update in-memory cache
+            # Update in-memory cache; re-point the username index if the
+            # username changed
+            old_username = existing_character.get("username")
             self.characters[user_id] = character
+            if character.get("username") != old_username:
+                if old_username:
+                    self._username_index.pop(old_username.lower(), None)
+                if character.get("username"):
+                    self._username_index[character["username"].lower()] = user_id
             
             # Save to file
             await self.save_characters()
@@ -247,8 +359,10 @@ class CharacterManager:
             return False
             
         try:
-            # Remove from in-memory cache
+            # Remove from in-memory cache and the username index
             character = self.characters.pop(user_id)
+            if character.get("username"):
+                self._username_index.pop(character["username"].lower(), None)
             
             # Save to file
             await self.save_characters()
@@ -2,18 +2,47 @@
 Bishop Bot - Character Manager
 Last updated: 2025-05-31 18:16:31 UTC by Bioku87
 """
+import copy
 import os
 import json
 import logging
+from collections import OrderedDict
+from datetime import datetime
 import discord
 from typing import Dict, List, Any, Optional, Union
 from database.manager import DatabaseManager
 
+# Use orjson for the hot serialize/parse paths when available; character
+# construction parses five JSON fields per row and to_dict re-encodes them
+try:
+    import orjson
+    
+    def _json_loads(value):
+        return orjson.loads(value)
+    
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    def _json_loads(value):
+        return json.loads(value)
+    
+    def _json_dumps(obj):
+        return json.dumps(obj)
+
 logger = logging.getLogger('bishop_bot.characters')
 
 class Character:
     """Represents a character in the system"""
     
+    # Slots drop the per-instance __dict__; bulk queries build one
+    # Character per row, so the savings scale with roster size
+    __slots__ = (
+        'id', 'name', 'player_id', 'guild_id',
+        'character_class', 'level', 'race', 'background', 'alignment', 'experience',
+        'attributes', 'skills', 'inventory', 'spells', 'features', 'notes',
+        '_shared_fields',
+    )
+    
     def __init__(self, **kwargs):
         # Basic info
         self.id = kwargs.get('id')
@@ -39,17 +68,25 @@ class Character:
         self.features = kwargs.get('features', {})
         self.notes = kwargs.get('notes', '')
         
+        # Fields still shared by reference with the template; see own()
+        self._shared_fields = set()
+        
         # Parse JSON fields if they're strings
         for field in ['attributes', 'skills', 'inventory', 'spells', 'features']:
             value = getattr(self, field)
             if isinstance(value, str):
                 try:
-                    setattr(self, field, json.loads(value))
-                except json.JSONDecodeError:
+                    setattr(self, field, _json_loads(value))
+                except ValueError:
                     setattr(self, field, {})
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert character to dictionary"""
+    def to_json_dict(self) -> Dict[str, Any]:
+        """Convert character to a dictionary with native nested fields
+        
+        Use this when the result is serialized as a whole (exports); the
+        nested dicts are encoded once by the outer dump instead of being
+        pre-encoded and then re-escaped as strings.
+        """
         return {
             'id': self.id,
             'name': self.name,
@@ -61,14 +98,35 @@ class Character:
             'background': self.background,
             'alignment': self.alignment,
             'experience': self.experience,
-            'attributes': json.dumps(self.attributes),
-            'skills': json.dumps(self.skills),
-            'inventory': json.dumps(self.inventory),
-            'spells': json.dumps(self.spells),
-            'features': json.dumps(self.features),
+            'attributes': self.attributes,
+            'skills': self.skills,
+            'inventory': self.inventory,
+            'spells': self.spells,
+            'features': self.features,
             'notes': self.notes
         }
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert character to a dictionary for database binding"""
+        data = self.to_json_dict()
+        for field in ('attributes', 'skills', 'inventory', 'spells', 'features'):
+            data[field] = _json_dumps(data[field])
+        return data
+    
+    def own(self, field: str) -> Dict[str, Any]:
+        """Return a privately owned, mutable copy of a dict field
+        
+        Template defaults are shared by reference across characters until
+        a mutation is needed; call this before writing into attributes,
+        skills, inventory, spells or features.
+        """
+        value = getattr(self, field)
+        if field in self._shared_fields:
+            value = copy.deepcopy(value)
+            setattr(self, field, value)
+            self._shared_fields.discard(field)
+        return value
+    
     def get_ability_modifier(self, ability: str) -> int:
         """Get ability modifier for a stat"""
         ability = ability.lower()
@@ -119,26 +177,31 @@ class Character:
             inline=False
         )
         
+        # Compute the modifier table and proficiency bonus once for the
+        # whole render instead of per attribute and per skill
+        mods = {attr: (value - 10) // 2 for attr, value in self.attributes.items()}
+        prof_bonus = self.get_proficiency_bonus()
+        
         # Attributes
-        attr_text = ""
-        for attr, value in self.attributes.items():
-            modifier = self.get_ability_modifier(attr)
-            sign = "+" if modifier >= 0 else ""
-            attr_text += f"**{attr.upper()}:** {value} ({sign}{modifier})\n"
+        attr_text = "".join(
+            f"**{attr.upper()}:** {value} ({'+' if mods[attr] >= 0 else ''}{mods[attr]})\n"
+            for attr, value in self.attributes.items()
+        )
         
         embed.add_field(name="Attributes", value=attr_text or "None", inline=True)
         
         # Skills
         if self.skills:
-            skill_text = ""
+            skill_lines = []
             for skill, info in self.skills.items():
                 if info.get('proficient', False):
-                    bonus = self.get_skill_bonus(skill)
+                    bonus = mods.get(info.get('ability', 'dexterity'), 0)
+                    bonus += prof_bonus * 2 if info.get('expertise', False) else prof_bonus
                     sign = "+" if bonus >= 0 else ""
-                    skill_text += f"**{skill.title()}:** {sign}{bonus}\n"
+                    skill_lines.append(f"**{skill.title()}:** {sign}{bonus}\n")
             
-            if skill_text:
-                embed.add_field(name="Proficient Skills", value=skill_text, inline=True)
+            if skill_lines:
+                embed.add_field(name="Proficient Skills", value="".join(skill_lines), inline=True)
         
         return embed
 
@@ -150,16 +213,34 @@ class CharacterManager:
         """Initialize the character manager"""
         self.bot = bot
         self.db = DatabaseManager()
-        self.characters_cache = {}  # player_id -> {character_id -> Character}
+        # player_id -> {character_id -> Character}; bounded LRU over
+        # players so the cache cannot grow with the whole install base
+        self.characters_cache = OrderedDict()
+        self._template = None  # parsed character template, loaded once
         
         # Ensure character templates directory exists
         os.makedirs("config/templates", exist_ok=True)
         
         # Create default character template if it doesn't exist
         self._create_default_template()
+        self.reload_template()
         
         logger.info("Character manager initialized")
     
+    # Most recently used players kept in cache
+    _CACHE_MAX_PLAYERS = 1000
+    
+    def _cache_bucket(self, player_id) -> Dict[int, Character]:
+        """Get (or create) a player's cache bucket, refreshing LRU order"""
+        bucket = self.characters_cache.get(player_id)
+        if bucket is None:
+            bucket = self.characters_cache[player_id] = {}
+            while len(self.characters_cache) > self._CACHE_MAX_PLAYERS:
+                self.characters_cache.popitem(last=False)
+        else:
+            self.characters_cache.move_to_end(player_id)
+        return bucket
+    
     def _create_default_template(self):
         """Create default character template"""
         template_path = "config/templates/dnd5e_character.json"
@@ -202,6 +283,17 @@ class CharacterManager:
             
             logger.info(f"Created default character template at {template_path}")
     
+    def reload_template(self):
+        """Load (or re-load) the parsed character template into memory"""
+        template_path = "config/templates/dnd5e_character.json"
+        try:
+            # One whole-file read parses faster than streaming json.load
+            with open(template_path, "rb") as f:
+                self._template = _json_loads(f.read())
+        except Exception as e:
+            logger.error(f"Error loading character template: {e}")
+            self._template = None
+    
     def create_character(self, player_id: str, guild_id: str, name: str, **kwargs) -> Character:
         """Create a new character"""
         # Create character object
@@ -212,22 +304,20 @@ class CharacterManager:
             **kwargs
         }
         
-        # Apply default template for missing fields
-        template_path = "config/templates/dnd5e_character.json"
-        if os.path.exists(template_path):
-            try:
-                with open(template_path, "r") as f:
-                    template = json.load(f)
-                
-                # Apply template defaults for attributes and skills
-                if 'attributes' not in character_data and 'attributes' in template:
-                    character_data['attributes'] = template['attributes']
-                if 'skills' not in character_data and 'skills' in template:
-                    character_data['skills'] = template['skills']
-            except Exception as e:
-                logger.error(f"Error loading character template: {e}")
+        # Apply default template for missing fields; the template is
+        # parsed once at startup and its dicts are shared by reference.
+        # Character.own() copies a field if a mutation is ever needed, so
+        # the common read-only path allocates nothing
+        template = self._template
+        shared = []
+        if template:
+            for field in ('attributes', 'skills'):
+                if field not in character_data and field in template:
+                    character_data[field] = template[field]
+                    shared.append(field)
         
         character = Character(**character_data)
+        character._shared_fields.update(shared)
         
         # Save to database
         try:
@@ -235,9 +325,7 @@ class CharacterManager:
             character.id = character_id
             
             # Update cache
-            if player_id not in self.characters_cache:
-                self.characters_cache[player_id] = {}
-            self.characters_cache[player_id][character_id] = character
+            self._cache_bucket(player_id)[character_id] = character
             
             logger.info(f"Created character '{name}' for player {player_id}")
             return character
@@ -261,10 +349,7 @@ class CharacterManager:
             character = Character(**character_data)
             
             # Update cache
-            player_id = character.player_id
-            if player_id not in self.characters_cache:
-                self.characters_cache[player_id] = {}
-            self.characters_cache[player_id][character_id] = character
+            self._cache_bucket(character.player_id)[character_id] = character
             
             return character
         except Exception as e:
@@ -285,17 +370,37 @@ class CharacterManager:
             characters = [Character(**data) for data in character_data_list]
             
             # Update cache
-            if player_id not in self.characters_cache:
-                self.characters_cache[player_id] = {}
-            
+            bucket = self._cache_bucket(player_id)
             for character in characters:
-                self.characters_cache[player_id][character.id] = character
+                bucket[character.id] = character
             
             return characters
         except Exception as e:
             logger.error(f"Error getting characters for player {player_id}: {e}")
             return []
     
+    def get_player_character_summaries(self, player_id: str, guild_id: str = None, limit: int = 25) -> List[Dict[str, Any]]:
+        """Get lightweight character summaries for a player.
+
+        Selects only the columns needed for list displays instead of
+        hydrating full Character objects with their stat blobs; the limit
+        matches Discord's 25-field embed cap.
+        """
+        try:
+            if guild_id:
+                query = ("SELECT id, name, level, race, character_class FROM characters "
+                         "WHERE player_id = ? AND guild_id = ? LIMIT ?")
+                params = (player_id, guild_id, limit)
+            else:
+                query = ("SELECT id, name, level, race, character_class FROM characters "
+                         "WHERE player_id = ? LIMIT ?")
+                params = (player_id, limit)
+
+            return self.db.fetchall(query, params)
+        except Exception as e:
+            logger.error(f"Error getting character summaries for player {player_id}: {e}")
+            return []
+
     def update_character(self, character: Character) -> bool:
         """Update a character"""
         if not character.id:
@@ -307,8 +412,9 @@ class CharacterManager:
             # Remove ID from update data
             character_id = character_dict.pop('id')
             
-            # Add updated timestamp
-            character_dict['updated_at'] = 'CURRENT_TIMESTAMP'
+            # Add updated timestamp; the quoted SQL keyword used here
+            # before was stored as the literal string "CURRENT_TIMESTAMP"
+            character_dict['updated_at'] = datetime.now().isoformat()
             
             # Update database
             self.db.update('characters', character_dict, 'id = ?', (character_id,))
@@ -358,8 +464,11 @@ class CharacterManager:
             if format.lower() == 'json':
                 # Export as JSON
                 filename = f"data/exports/character_{character.name}_{character_id}.json"
-                with open(filename, 'w') as f:
-                    json.dump(character.to_dict(), f, indent=4)
+                # Serialize first; one buffered write instead of per-token
+                # calls, with nested fields encoded natively in one pass
+                payload = json.dumps(character.to_json_dict(), indent=4, ensure_ascii=False)
+                with open(filename, 'w', encoding='utf-8') as f:
+                    f.write(payload)
                 return filename
             else:
                 logger.error(f"Unsupported export format: {format}")
@@ -371,8 +480,9 @@ class CharacterManager:
     def import_character(self, player_id: str, guild_id: str, file_path: str) -> Optional[Character]:
         """Import a character from a file"""
         try:
-            with open(file_path, 'r') as f:
-                character_data = json.load(f)
+            # One whole-file read parses faster than streaming json.load
+            with open(file_path, 'rb') as f:
+                character_data = _json_loads(f.read())
             
             # Override player_id and guild_id with current values
             character_data['player_id'] = player_id
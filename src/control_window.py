@@ -18,6 +18,9 @@ from typing import Dict, List, Optional, Any, Union
 
 logger = logging.getLogger('bishop_bot.control_window')
 
+# Audio extensions accepted by the soundboard (dotless, lowercase)
+_AUDIO_EXTS = frozenset(('mp3', 'wav', 'ogg', 'flac'))
+
 class ControlWindow:
     """Main control window for Bishop Bot"""
     
@@ -1044,8 +1047,7 @@ class ControlWindow:
                 return
                 
             # List files with audio extensions
-            audio_extensions = ('.mp3', '.wav', '.ogg', '.flac')
-            files = [f for f in os.listdir(group_dir) if f.lower().endswith(audio_extensions)]
+            files = [f for f in os.listdir(group_dir) if f.rpartition('.')[2].lower() in _AUDIO_EXTS]
             
             # Add to listbox
             for file in sorted(files):
@@ -1385,8 +1387,7 @@ class ControlWindow:
             
             if os.path.exists(category_dir):
                 # List audio files
-                audio_extensions = ('.mp3', '.wav', '.ogg', '.flac')
-                sound_files = [f for f in os.listdir(category_dir) if f.lower().endswith(audio_extensions)]
+                sound_files = [f for f in os.listdir(category_dir) if f.rpartition('.')[2].lower() in _AUDIO_EXTS]
             
             if not sound_files:
                 messagebox.showinfo("No Sounds", f"No sounds found in category '{category_name}'")
@@ -1472,8 +1473,7 @@ class ControlWindow:
                 category_dir = f"data/audio/soundboard/{category}"
                 if os.path.exists(category_dir):
                     # List audio files
-                    audio_extensions = ('.mp3', '.wav', '.ogg', '.flac')
-                    sound_files = [f for f in os.listdir(category_dir) if f.lower().endswith(audio_extensions)]
+                    sound_files = [f for f in os.listdir(category_dir) if f.rpartition('.')[2].lower() in _AUDIO_EXTS]
                     
                     # Create sound objects
                     sounds = [type('Sound', (), {'name': os.path.splitext(f)[0], 'file_path': os.path.join(category_dir, f)}) 
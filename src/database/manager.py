@@ -6,6 +6,7 @@ import os
 import sqlite3
 import logging
 import json
+import threading
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Union
 
@@ -22,6 +23,12 @@ class DatabaseManager:
         
         self.db_path = db_path
         
+        # Connections are reused per thread instead of opened per query;
+        # worker threads each keep their own, tracked here for close()
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        
         # Ensure directory exists
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
         
@@ -64,9 +71,8 @@ class DatabaseManager:
             )
             ''')
             
-            # Commit changes and close
+            # Commit changes; the connection stays pooled for reuse
             conn.commit()
-            conn.close()
             
             logger.info("Database schema initialized")
         except Exception as e:
@@ -74,14 +80,24 @@ class DatabaseManager:
             raise
     
     def _get_connection(self):
-        """Get a connection to the database"""
+        """Get this thread's pooled connection, opening it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            return conn
+        
         try:
-            conn = sqlite3.connect(self.db_path)
+            # Queries stay on the owning thread; the flag only lets
+            # close() tear connections down from the shutdown thread
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
             conn.row_factory = sqlite3.Row  # Return rows as dictionaries
-            return conn
         except Exception as e:
             logger.error(f"Error connecting to database: {e}")
             raise
+        
+        self._local.conn = conn
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
     
     def get_value(self, key: str) -> Optional[str]:
         """Get a value from the bot_data table"""
@@ -90,7 +106,6 @@ class DatabaseManager:
             cursor = conn.cursor()
             cursor.execute("SELECT value FROM bot_data WHERE key = ?", (key,))
             result = cursor.fetchone()
-            conn.close()
             
             if result:
                 return result['value']
@@ -109,7 +124,6 @@ class DatabaseManager:
                 (key, value)
             )
             conn.commit()
-            conn.close()
             return True
         except Exception as e:
             logger.error(f"Error setting value for key '{key}': {e}")
@@ -122,7 +136,6 @@ class DatabaseManager:
             cursor = conn.cursor()
             cursor.execute("SELECT settings FROM guild_settings WHERE guild_id = ?", (guild_id,))
             result = cursor.fetchone()
-            conn.close()
             
             if result:
                 return json.loads(result['settings'])
@@ -141,7 +154,6 @@ class DatabaseManager:
                 (guild_id, json.dumps(settings), datetime.now().isoformat())
             )
             conn.commit()
-            conn.close()
             return True
         except Exception as e:
             logger.error(f"Error saving settings for guild {guild_id}: {e}")
@@ -161,7 +173,6 @@ class DatabaseManager:
                 (guild_id, session_id, file_path, datetime.now().isoformat(), json.dumps(metadata))
             )
             conn.commit()
-            conn.close()
             return True
         except Exception as e:
             logger.error(f"Error saving transcript metadata for guild {guild_id}, session {session_id}: {e}")
@@ -177,7 +188,6 @@ class DatabaseManager:
                 (guild_id,)
             )
             results = cursor.fetchall()
-            conn.close()
             
             transcripts = []
             for row in results:
@@ -192,7 +202,35 @@ class DatabaseManager:
             logger.error(f"Error getting transcripts for guild {guild_id}: {e}")
             return []
     
+    def fetchall(self, query: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        """Run a read query and return all rows as dictionaries"""
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            return [dict(row) for row in cursor.fetchall()]
+        except Exception as e:
+            logger.error(f"Error running query: {e}")
+            return []
+
+    def executemany(self, query: str, params: List[tuple]) -> bool:
+        """Execute a parameterized statement for many rows in one transaction"""
+        try:
+            conn = self._get_connection()
+            conn.executemany(query, params)
+            conn.commit()
+            return True
+        except Exception as e:
+            logger.error(f"Error executing batch statement: {e}")
+            return False
+    
     def close(self):
-        """Close any open connections"""
-        # No persistent connections to close in this implementation
-        pass
\ No newline at end of file
+        """Close all pooled connections"""
+        with self._connections_lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except Exception as e:
+                    logger.error(f"Error closing database connection: {e}")
+            self._connections.clear()
+        self._local = threading.local()
\ No newline at end of file
@@ -5,6 +5,7 @@ Last updated: 2025-05-31 18:33:27 UTC by Bioku87
 import re
 import random
 import logging
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Tuple, Union
 
 logger = logging.getLogger('bishop_bot.dice')
@@ -44,22 +45,7 @@ class DiceManager:
     
     def parse_expression(self, expression: str) -> Tuple[int, int, str, int]:
         """Parse a dice expression into components"""
-        match = self.DICE_PATTERN.match(expression.lower().replace(' ', ''))
-        if not match:
-            raise ValueError(f"Invalid dice expression: {expression}")
-        
-        num_dice = int(match.group(1))
-        sides = int(match.group(2))
-        
-        # Get operator and modifier if present
-        if match.group(3) and match.group(4):
-            operator = match.group(3)
-            modifier = int(match.group(4))
-        else:
-            operator = '+'
-            modifier = 0
-        
-        return num_dice, sides, operator, modifier
+        return _parse_simple(expression.lower().replace(' ', ''))
     
     def roll(self, expression: str) -> DiceRoll:
         """Roll dice based on the given expression"""
@@ -94,56 +80,9 @@ class DiceManager:
     def roll_advanced(self, expression: str) -> DiceRoll:
         """Roll dice with advanced options"""
         try:
-            match = self.ADV_DICE_PATTERN.match(expression.lower().replace(' ', ''))
-            if not match:
-                raise ValueError(f"Invalid dice expression: {expression}")
-            
-            num_dice = int(match.group(1)) if match.group(1) else 1
-            sides = int(match.group(2))
-            options = match.group(3) if match.group(3) else ""
-            
-            # Validate input
-            if num_dice <= 0 or sides <= 0:
-                raise ValueError(f"Invalid dice parameters: {num_dice}d{sides}")
-            if num_dice > 100:
-                raise ValueError(f"Too many dice: {num_dice} (max 100)")
-            if sides > 1000:
-                raise ValueError(f"Too many sides: {sides} (max 1000)")
-            
-            # Parse options
-            advantage = False
-            disadvantage = False
-            keep_highest = 0
-            keep_lowest = 0
-            exploding = False
-            reroll_threshold = 0
-            modifier = 0
-            
-            # Extract modifier
-            mod_match = re.search(r'([+-])(\d+)$', options)
-            if mod_match:
-                mod_operator = mod_match.group(1)
-                mod_value = int(mod_match.group(2))
-                modifier = mod_value if mod_operator == '+' else -mod_value
-                options = options[:mod_match.start()]
-            
-            # Parse special operators
-            for op_match in self.OPERATORS.finditer(options):
-                op = op_match.group(1)
-                value = int(op_match.group(2)) if op_match.group(2) else 0
-                
-                if op == 'a':
-                    advantage = True
-                elif op == 'd':
-                    disadvantage = True
-                elif op == 'k':
-                    keep_highest = value if value else num_dice
-                elif op == 'x':
-                    keep_lowest = value if value else num_dice
-                elif op == '!':
-                    exploding = True
-                elif op == 'r':
-                    reroll_threshold = value if value else 1
+            (num_dice, sides, advantage, disadvantage, keep_highest,
+             keep_lowest, exploding, reroll_threshold, modifier) = _parse_advanced(
+                expression.lower().replace(' ', ''))
             
             # Roll dice with options
             rolls = []
@@ -297,4 +236,85 @@ class DiceManager:
                 # Skip invalid expressions
                 pass
         
-        return results
\ No newline at end of file
+        return results
+
+
+# Parsing is a pure function of the expression string, so hot expressions
+# like "1d20" resolve to cached tuples; the RNG sampling is never cached
+
+@lru_cache(maxsize=1024)
+def _parse_simple(expression: str) -> Tuple[int, int, str, int]:
+    """Parse a normalized simple dice expression into (dice, sides, op, modifier)"""
+    match = DiceManager.DICE_PATTERN.match(expression)
+    if not match:
+        raise ValueError(f"Invalid dice expression: {expression}")
+
+    num_dice = int(match.group(1))
+    sides = int(match.group(2))
+
+    # Get operator and modifier if present
+    if match.group(3) and match.group(4):
+        operator = match.group(3)
+        modifier = int(match.group(4))
+    else:
+        operator = '+'
+        modifier = 0
+
+    return num_dice, sides, operator, modifier
+
+@lru_cache(maxsize=1024)
+def _parse_advanced(expression: str) -> Tuple[int, int, bool, bool, int, int, bool, int, int]:
+    """Parse a normalized advanced dice expression into its option tuple"""
+    match = DiceManager.ADV_DICE_PATTERN.match(expression)
+    if not match:
+        raise ValueError(f"Invalid dice expression: {expression}")
+
+    num_dice = int(match.group(1)) if match.group(1) else 1
+    sides = int(match.group(2))
+    options = match.group(3) if match.group(3) else ""
+
+    # Validate input
+    if num_dice <= 0 or sides <= 0:
+        raise ValueError(f"Invalid dice parameters: {num_dice}d{sides}")
+    if num_dice > 100:
+        raise ValueError(f"Too many dice: {num_dice} (max 100)")
+    if sides > 1000:
+        raise ValueError(f"Too many sides: {sides} (max 1000)")
+
+    # Parse options
+    advantage = False
+    disadvantage = False
+    keep_highest = 0
+    keep_lowest = 0
+    exploding = False
+    reroll_threshold = 0
+    modifier = 0
+
+    # Extract modifier
+    mod_match = re.search(r'([+-])(\d+)$', options)
+    if mod_match:
+        mod_operator = mod_match.group(1)
+        mod_value = int(mod_match.group(2))
+        modifier = mod_value if mod_operator == '+' else -mod_value
+        options = options[:mod_match.start()]
+
+    # Parse special operators
+    for op_match in DiceManager.OPERATORS.finditer(options):
+        op = op_match.group(1)
+        value = int(op_match.group(2)) if op_match.group(2) else 0
+
+        if op == 'a':
+            advantage = True
+        elif op == 'd':
+            disadvantage = True
+        elif op == 'k':
+            keep_highest = value if value else num_dice
+        elif op == 'x':
+            keep_lowest = value if value else num_dice
+        elif op == '!':
+            exploding = True
+        elif op == 'r':
+            reroll_threshold = value if value else 1
+
+    return (num_dice, sides, advantage, disadvantage, keep_highest,
+            keep_lowest, exploding, reroll_threshold, modifier)
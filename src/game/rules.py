@@ -17,6 +17,9 @@ class RulesManager:
         """Initialize the rules manager"""
         self.rules_data = {}
         self.loaded_systems = []
+        # Per-system search corpus: (lowered name, lowered description,
+        # category, rule) tuples built once at load time
+        self._search_index = {}
         
         # Load available rule systems
         self.load_available_systems()
@@ -85,6 +88,7 @@ class RulesManager:
                 rules_data["categories"][category] = category_data
             
             self.rules_data[system_name] = rules_data
+            self._build_search_index(system_name)
             logger.info(f"Loaded rule system: {system_name}")
             
             return True
@@ -117,25 +121,47 @@ class RulesManager:
         
         return None
     
+    def _build_search_index(self, system_name: str):
+        """Precompute per-rule derived data for a loaded system"""
+        index = []
+        for category, category_data in self.rules_data[system_name]["categories"].items():
+            for rule in category_data:
+                # Render-ready lookup strings, built once at load instead
+                # of sliced and formatted on every /lookup response
+                rule["_field_name"] = f"{rule.get('name', 'Unknown')} ({category})"
+                rule["_desc_truncated"] = (rule.get('description') or 'No description available')[:1024]
+                # Display fields beyond name/description, filtered and
+                # title-cased once at load instead of per lookup
+                rule["_extra_fields"] = [
+                    (key.title(), value)
+                    for key, value in rule.items()
+                    if key not in ("name", "description", "_field_name", "_desc_truncated") and isinstance(value, str)
+                ]
+                index.append((
+                    rule.get("name", "").lower(),
+                    rule.get("description", "").lower(),
+                    category,
+                    rule
+                ))
+        self._search_index[system_name] = index
+    
     def search_rules(self, system_name: str, query: str) -> List[Dict[str, Any]]:
         """Search for rules matching the query"""
         if system_name not in self.rules_data:
             if not self.load_system(system_name):
                 return []
         
+        # Scan the precomputed corpus; the C-level substring search runs on
+        # strings lowered once at load time instead of per query
         results = []
         query = query.lower()
         
-        for category, category_data in self.rules_data[system_name]["categories"].items():
-            for rule in category_data:
-                rule_name = rule.get("name", "").lower()
-                rule_desc = rule.get("description", "").lower()
-                
-                if query in rule_name or query in rule_desc:
-                    # Add category to the rule for context
-                    rule_copy = rule.copy()
-                    rule_copy["category"] = category
-                    results.append(rule_copy)
+        for rule_name, rule_desc, category, rule in self._search_index.get(system_name, ()):
+            if query in rule_name or query in rule_desc:
+                # Add category to the rule for context
+                rule_copy = rule.copy()
+                rule_copy["category"] = category
+                results.append(rule_copy)
         
         return results
     
@@ -95,6 +95,8 @@ class VoiceManager:
         self.recording_sessions = {}
         self.user_audio_maps = {}
         self.transcription_model = None
+        # Decoded transcript cache keyed by (path, mtime_ns)
+        self._transcript_contents = {}
         
         # Set up transcription if available
         self._setup_transcription()
@@ -398,16 +400,24 @@ class VoiceManager:
                 os.makedirs(session_path, exist_ok=True)
                 return []
             
-            # Find transcript files
+            # Find transcript files. scandir surfaces each entry's stat
+            # result directly, so matching files are never re-resolved by
+            # path and non-transcript names are rejected before any stat
             transcripts = []
-            for root, dirs, files in os.walk(session_path):
-                for file in files:
-                    if file.endswith("_transcript.txt") or file.endswith("_timestamped.txt"):
-                        transcript_path = os.path.join(root, file)
-                        timestamp = os.path.getmtime(transcript_path)
+            pending = [session_path]
+            while pending:
+                directory = pending.pop()
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                            continue
+                        if not entry.name.endswith(("_transcript.txt", "_timestamped.txt")):
+                            continue
+                        timestamp = entry.stat().st_mtime
                         transcripts.append({
-                            "path": transcript_path,
-                            "filename": file,
+                            "path": entry.path,
+                            "filename": entry.name,
                             "timestamp": timestamp,
                             "date": datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
                         })
@@ -422,18 +432,57 @@ class VoiceManager:
     
     async def read_transcript(self, transcript_path):
         """Read a transcript file"""
-        try:
-            if not os.path.exists(transcript_path):
-                return None
-                
+        def _read():
+            # Key on mtime so a regenerated transcript invalidates itself
+            mtime = os.stat(transcript_path).st_mtime_ns
+            key = (transcript_path, mtime)
+            content = self._transcript_contents.get(key)
+            if content is not None:
+                return content
+
             with open(transcript_path, "r", encoding="utf-8") as f:
                 content = f.read()
-                
+
+            # Drop oldest entries once the cache is full
+            while len(self._transcript_contents) >= 64:
+                self._transcript_contents.pop(next(iter(self._transcript_contents)))
+            self._transcript_contents[key] = content
             return content
+
+        try:
+            # Disk read runs off the event loop; repeat reads hit the cache
+            return await asyncio.to_thread(_read)
+        except FileNotFoundError:
+            return None
         except Exception as e:
             logger.error(f"Error reading transcript: {e}")
             return None
-    
+
+    async def read_transcript_head_tail(self, transcript_path, head_bytes=1500, tail_bytes=1500):
+        """Read only the head and tail of a transcript without loading the full file"""
+        def _read():
+            size = os.path.getsize(transcript_path)
+            with open(transcript_path, "rb") as f:
+                head = f.read(head_bytes)
+                if size > head_bytes + tail_bytes:
+                    f.seek(-tail_bytes, os.SEEK_END)
+                    tail = f.read(tail_bytes)
+                else:
+                    tail = b""
+            return (
+                head.decode("utf-8", errors="replace"),
+                tail.decode("utf-8", errors="replace"),
+            )
+
+        try:
+            if not os.path.exists(transcript_path):
+                return None, None
+
+            return await asyncio.to_thread(_read)
+        except Exception as e:
+            logger.error(f"Error reading transcript head/tail: {e}")
+            return None, None
+
     def is_connected(self, guild_id):
         """Check if connected to voice in a guild"""
         if not hasattr(self, 'voice_clients') or self.voice_clients is None: